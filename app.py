@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as _dt
+import logging
 import sys
 import threading
 import traceback
@@ -63,6 +64,11 @@ def _install_crash_hooks() -> None:
 
 _install_crash_hooks()
 
+# No handler on purpose: records fall through to logging.lastResort, which writes to the
+# *current* sys.stderr, so the console tee installed by MainShellWindow still captures them.
+logging.getLogger().setLevel(logging.WARNING)
+
+from PyQt5.QtGui import QPixmapCache
 from PyQt5.QtWidgets import QApplication
 
 from app_platform.paths import app_stylesheet_path
@@ -73,6 +79,8 @@ from styles.ui_scale import scale_stylesheet, set_ui_scale_factor
 from ui.main_window_shell import MainShellWindow
 
 app = QApplication(sys.argv)
+# Logo / icon pixmaps are shared through QPixmapCache (KB; bounds decoded image memory).
+QPixmapCache.setCacheLimit(10240)
 
 prefs = load_ui_preferences()
 _scr = app.primaryScreen()
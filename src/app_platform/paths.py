@@ -71,13 +71,45 @@ def _session_dirs_equal(a: Path, b: Path) -> bool:
         return False
 
 
-def _bundle_folder_for_flat_stem(root: Path, stem: str) -> Path | None:
-    """Folder under ``root`` whose name matches ``stem`` case-insensitively (Windows-safe)."""
-    key = stem.lower()
-    for sub in root.iterdir():
-        if sub.is_dir() and sub.name.lower() == key:
-            return sub
-    return None
+def _subdirs(root: Path) -> list[Path]:
+    """Direct child folders of ``root``.
+
+    Uses ``os.scandir`` so the directory check comes from the readdir entry
+    instead of one extra ``stat`` per child.
+    """
+    out: list[Path] = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        out.append(root / entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return out
+
+
+def _subdirs_by_lower_name(subdirs: list[Path]) -> dict[str, Path]:
+    """Lower-cased folder name → first folder with that name (listing order)."""
+    out: dict[str, Path] = {}
+    for sub in subdirs:
+        out.setdefault(sub.name.lower(), sub)
+    return out
+
+
+def _bundle_folder_for_flat_stem(
+    root: Path, stem: str, subdirs: dict[str, Path] | None = None
+) -> Path | None:
+    """Folder under ``root`` whose name matches ``stem`` case-insensitively (Windows-safe).
+
+    Pass ``subdirs`` (from :func:`_subdirs_by_lower_name`) when resolving many stems
+    against the same ``root`` so the directory is listed only once.
+    """
+    if subdirs is None:
+        subdirs = _subdirs_by_lower_name(_subdirs(root))
+    return subdirs.get(stem.lower())
 
 
 def is_session_bundle_json(path: Path) -> bool:
@@ -96,9 +128,9 @@ def iter_session_json_files_on_disk() -> list[Path]:
     out: list[Path] = []
     if not root.is_dir():
         return out
-    for sub in sorted(root.iterdir()):
-        if not sub.is_dir():
-            continue
+    children = _subdirs(root)
+    subdirs = _subdirs_by_lower_name(children)
+    for sub in sorted(children):
         jp = sub / SESSION_JSON_FILENAME
         if jp.is_file():
             out.append(jp)
@@ -107,7 +139,7 @@ def iter_session_json_files_on_disk() -> list[Path]:
             continue
         if jp.name.lower() == SESSION_JSON_FILENAME.lower():
             continue
-        folder = _bundle_folder_for_flat_stem(root, jp.stem)
+        folder = _bundle_folder_for_flat_stem(root, jp.stem, subdirs)
         if folder is not None and (folder / SESSION_JSON_FILENAME).is_file():
             continue
         out.append(jp)
@@ -124,12 +156,13 @@ def migrate_flat_session_json_into_bundle_dirs() -> None:
     root = sessions_dir()
     if not root.is_dir():
         return
+    subdirs = _subdirs_by_lower_name(_subdirs(root))
     for jp in list(root.glob("*.json")):
         if not jp.is_file():
             continue
         if jp.name.lower() == SESSION_JSON_FILENAME.lower():
             continue
-        folder = _bundle_folder_for_flat_stem(root, jp.stem)
+        folder = _bundle_folder_for_flat_stem(root, jp.stem, subdirs)
         if folder is None:
             continue
         dest = folder / SESSION_JSON_FILENAME
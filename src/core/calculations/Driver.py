@@ -7,8 +7,7 @@ import pandas as pd
 
 from .cancelled import CalculationAborted
 from .Metrics import (
-    calc_fin_angle, calc_yaw, calc_spine_angles, calc_tail_angle,
-    calc_tail_side_and_distance, calc_furthest_tail_point, detect_fin_peaks, get_time_ranges,
+    MetricsContext, PointArray, calc_spine_angles, detect_fin_peaks, get_time_ranges,
 )
 from .custom_angle import build_three_point_angle_column
 
@@ -34,25 +33,28 @@ def run_calculations(
     vp = config["video_parameters"]
     scale_factor = vp["pixel_scale_factor"] * vp["dish_diameter_m"] / vp["pixel_diameter"]
 
-    clp1 = parsed_points["clp1"]
-    clp2 = parsed_points["clp2"]
-    left_fins = parsed_points["left_fin"]
-    right_fins = parsed_points["right_fin"]
-    tail = parsed_points["tail"]
+    # Coerce each point the metrics read once; clp1/clp2 feed five of them.
+    clp1 = PointArray.of(parsed_points["clp1"])
+    clp2 = PointArray.of(parsed_points["clp2"])
+    left_fins = [PointArray.of(p) for p in parsed_points["left_fin"]]
+    right_fins = [PointArray.of(p) for p in parsed_points["right_fin"]]
+    tail = [PointArray.of(p) for p in parsed_points["tail"]]
     tail_points = parsed_points["tailPoints"]
-    tp = parsed_points["tp"] 
+    tp = PointArray.of(parsed_points["tp"])
     head = parsed_points["head"]
-    spine = parsed_points["spine"]
+    spine = [PointArray.of(p) for p in parsed_points["spine"]]
 
-    left_fin_angle = calc_fin_angle(clp1, clp2, left_fins, left_fin=True)
-    right_fin_angle = calc_fin_angle(clp1, clp2, right_fins, left_fin=False)
-    head_yaw = calc_yaw(clp1, clp2)
+    # Body-axis vectors, norms and heading are computed once for all axis-relative metrics.
+    axis = MetricsContext(clp1, clp2)
+    left_fin_angle = axis.fin_angle(left_fins, left_fin=True)
+    right_fin_angle = axis.fin_angle(right_fins, left_fin=False)
+    head_yaw = axis.yaw()
     head_x = head["x"] * scale_factor
     head_y = head["y"] * scale_factor
 
-    tail_angle = calc_tail_angle(clp1, clp2, tp)
-    sides, tail_distances, tail_distances_raw = calc_tail_side_and_distance(clp1, clp2, tp, scale_factor)
-    furthest_tail = calc_furthest_tail_point(clp1, clp2, tail, tail_points)
+    tail_angle = axis.tail_angle(tp)
+    sides, tail_distances, tail_distances_raw = axis.tail_side_and_distance(tp, scale_factor)
+    furthest_tail = axis.furthest_tail_point(tail, tail_points)
 
     buffer = config["graph_cutoffs"].get("peak_horizontal_buffer", 3)
     left_fin_peaks = detect_fin_peaks(left_fin_angle, buffer)
@@ -70,11 +72,10 @@ def run_calculations(
     # Fill swim bout columns
     bout_head_yaw = np.array([""] * n_frames, dtype=object)
     for start, end in time_ranges:
-        bout_yaw_center = head_yaw[start]
-        for i in range(start, end + 1):
-            if (i - start) & 0x3FF == 0 and cancel_check is not None and cancel_check():
-                raise CalculationAborted()
-            bout_head_yaw[i] = head_yaw[i] - bout_yaw_center
+        if cancel_check is not None and cancel_check():
+            raise CalculationAborted()
+        # Yaw relative to the bout's first frame, one array op per bout (later bouts win overlaps).
+        bout_head_yaw[start:end + 1] = list(head_yaw[start:end + 1] - head_yaw[start])
 
     results_dict = {
         "Time": np.arange(n_frames),
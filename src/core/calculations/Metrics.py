@@ -1,4 +1,65 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ---------------------------------------------------------------------------
+# Optional numba JIT for the peak kernels; the NumPy versions are the fallback
+# ---------------------------------------------------------------------------
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+class PointArray:
+    """
+    One body point's per-frame coordinates in a single ``(2, frames)`` float array: row 0 is
+    x, row 1 is y, so each row is contiguous. Indexes like the parser's ``{"x": ..., "y": ...}``
+    dicts, so every metric accepts either; converting once up front lets a run of metrics
+    share the same arrays instead of re-coercing each dict.
+    """
+
+    __slots__ = ("xy",)
+
+    def __init__(self, x, y, dtype=float):
+        self.xy = np.stack((np.asarray(x, dtype=dtype), np.asarray(y, dtype=dtype)))
+
+    @classmethod
+    def of(cls, point, dtype=float):
+        """``point`` itself if it is already a ``dtype`` PointArray, else a converted copy of its x/y."""
+        if isinstance(point, cls) and point.xy.dtype == np.dtype(dtype):
+            return point
+        return cls(point["x"], point["y"], dtype)
+
+    def __getitem__(self, key):
+        if key == "x":
+            return self.xy[0]
+        if key == "y":
+            return self.xy[1]
+        raise KeyError(key)
+
+    def __len__(self):
+        return self.xy.shape[1]
+
+
+def _xy(point, n, dtype=float):
+    """
+    ``point``'s x/y as ``dtype`` arrays of exactly ``n`` frames.
+
+    Shorter inputs are NaN-padded (the old per-frame loops produced NaN for frames they
+    could not index); longer inputs are truncated.
+    """
+    if isinstance(point, PointArray) and len(point) == n and point.xy.dtype == np.dtype(dtype):
+        return point.xy[0], point.xy[1]
+    out = []
+    for key in ("x", "y"):
+        arr = np.asarray(point[key], dtype=dtype)
+        if len(arr) != n:
+            padded = np.full(n, np.nan, dtype=dtype)
+            m = min(n, len(arr))
+            padded[:m] = arr[:m]
+            arr = padded
+        out.append(arr)
+    return out[0], out[1]
 
 
 def calc_fin_angle(head1_arr, head2_arr, fin_points_arr, left_fin=False):
@@ -14,26 +75,7 @@ def calc_fin_angle(head1_arr, head2_arr, fin_points_arr, left_fin=False):
     Returns:
         np.ndarray: Array of fin angles (in degrees) for each frame.
     """
-    n = len(head1_arr["x"])
-    angles = np.full(n, np.nan)
-    for i in range(n):
-        try:
-            h1 = np.array([head1_arr["x"][i], head1_arr["y"][i]])
-            h2 = np.array([head2_arr["x"][i], head2_arr["y"][i]])
-            v1 = h2 - h1
-            base = np.array([fin_points_arr[0]["x"][i], fin_points_arr[0]["y"][i]])
-            tip = np.array([fin_points_arr[-1]["x"][i], fin_points_arr[-1]["y"][i]])
-            v2 = tip - base
-            angle_rad = np.arctan2(v2[1], v2[0]) - np.arctan2(v1[1], v1[0])
-            angle_deg = np.degrees(angle_rad)
-            if angle_deg < -180:
-                angle_deg += 360
-            elif angle_deg > 180:
-                angle_deg -= 360
-            angles[i] = angle_deg if left_fin else -angle_deg
-        except Exception:
-            angles[i] = np.nan
-    return angles
+    return MetricsContext(head1_arr, head2_arr).fin_angle(fin_points_arr, left_fin=left_fin)
 
 
 def calc_three_point_angle(A, B, C, direction: str = "cw", min_conf=None):
@@ -118,18 +160,7 @@ def calc_yaw(head1_arr, head2_arr):
     Returns:
         np.ndarray: Array of yaw angles (in degrees) per frame.
     """
-    n = len(head1_arr["x"])
-    yaws = np.full(n, np.nan)
-    for i in range(n):
-        dx = head2_arr["x"][i] - head1_arr["x"][i]
-        dy = head2_arr["y"][i] - head1_arr["y"][i]
-        if np.isnan(dx) or np.isnan(dy):
-            yaws[i] = np.nan
-        else:
-            angle_rad = np.arctan2(dy, dx)
-            angle_deg = np.degrees(angle_rad)
-            yaws[i] = -angle_deg
-    return yaws
+    return MetricsContext(head1_arr, head2_arr).yaw()
 
 
 def get_angle_between_points(A, B, C):
@@ -155,6 +186,26 @@ def get_angle_between_points(A, B, C):
     return float(np.degrees(np.arccos(cosine_angle)))
 
 
+def _vertex_angles(ax, ay, bx, by, cx, cy):
+    """
+    Element-wise unsigned angle A-B-C at vertex B in degrees (0-180), like
+    :func:`get_angle_between_points` but over whole arrays. ``atan2(|cross|, dot)`` stays
+    accurate near 0°/180°, where ``arccos`` of the normalized dot loses precision.
+    Zero-length or non-finite vectors give NaN.
+    """
+    bax, bay = ax - bx, ay - by
+    return _ray_angles(bax, bay, np.hypot(bax, bay), cx - bx, cy - by)
+
+
+def _ray_angles(bax, bay, ba_norm, bcx, bcy):
+    """:func:`_vertex_angles` from the two rays at the vertex, with BA's length precomputed."""
+    cross = bax * bcy - bay * bcx
+    dot = bax * bcx + bay * bcy
+    angles = np.degrees(np.arctan2(np.abs(cross), dot))
+    degenerate = (ba_norm == 0) | (np.hypot(bcx, bcy) == 0)
+    return np.where(degenerate, np.nan, angles)
+
+
 def calc_spine_angles(spine):
     """
     Compute angles between adjacent spine segments.
@@ -167,16 +218,12 @@ def calc_spine_angles(spine):
     """
     n_segments = len(spine) - 2
     n_frames = len(spine[0]["x"])
-    angles = np.full((n_frames, n_segments), np.nan)
-    for idx in range(n_segments):
-        ptA, ptB, ptC = spine[idx], spine[idx + 1], spine[idx + 2]
-        for f in range(n_frames):
-            angles[f, idx] = get_angle_between_points(
-                {k: ptA[k][f] for k in ["x", "y"]},
-                {k: ptB[k][f] for k in ["x", "y"]},
-                {k: ptC[k][f] for k in ["x", "y"]},
-            )
-    return angles
+    if n_segments <= 0:
+        return np.full((n_frames, n_segments), np.nan)
+    # (points, frames) coordinate grids; each angle uses three consecutive rows.
+    xs, ys = (np.stack(c) for c in zip(*(_xy(pt, n_frames) for pt in spine)))
+    angles = _vertex_angles(xs[:-2], ys[:-2], xs[1:-1], ys[1:-1], xs[2:], ys[2:])
+    return np.ascontiguousarray(angles.T)
 
 
 def calc_tail_angle(clp1, clp2, tp):
@@ -191,39 +238,112 @@ def calc_tail_angle(clp1, clp2, tp):
     Returns:
         np.ndarray: Tail angles (degrees) per frame.
     """
-    n = len(tp["x"])
-    return np.array([
-        get_angle_between_points(
-            {k: clp1[k][i] for k in ["x", "y"]},
-            {k: clp2[k][i] for k in ["x", "y"]},
-            {k: tp[k][i] for k in ["x", "y"]}
-        ) for i in range(n)
-    ])
+    return MetricsContext(clp1, clp2, len(tp["x"])).tail_angle(tp)
 
 
 def _signed_perp_distance_to_axis(
-    x1: float,
-    y1: float,
-    x2: float,
-    y2: float,
-    xt: float,
-    yt: float,
+    x1: np.ndarray,
+    y1: np.ndarray,
+    x2: np.ndarray,
+    y2: np.ndarray,
+    xt: np.ndarray,
+    yt: np.ndarray,
     eps: float = 1e-9,
-) -> float:
+) -> np.ndarray:
     """
-    Signed perpendicular distance from (xt, yt) to the infinite line through (x1,y1)-(x2,y2).
+    Signed perpendicular distance from (xt, yt) to the infinite line through (x1,y1)-(x2,y2),
+    element-wise over per-frame arrays (any broadcastable shapes).
 
     Matches the sign of ``(m*xt - yt + b) / sqrt(m**2+1)`` from the old ``np.polyfit`` formulation,
     but avoids ``polyfit`` entirely so vertical axes (x1 == x2) and near-degenerate segments do not
     raise ``LinAlgError`` / ``RankWarning`` (the latter can become an exception under strict filters).
+    Degenerate (shorter than ``eps``) or non-finite axes, and non-finite results, give NaN.
     """
-    dx = float(x2) - float(x1)
-    dy = float(y2) - float(y1)
-    denom = float(np.hypot(dx, dy))
-    if denom < eps or not np.isfinite(denom):
-        return float("nan")
-    rel = (dy * (float(xt) - float(x1)) - dx * (float(yt) - float(y1))) / denom
-    return float(rel) if np.isfinite(rel) else float("nan")
+    dx = x2 - x1
+    dy = y2 - y1
+    return _signed_offsets(x1, y1, dx, dy, np.hypot(dx, dy), xt, yt, eps)
+
+
+def _signed_offsets(x1, y1, dx, dy, denom, xt, yt, eps=1e-9):
+    """:func:`_signed_perp_distance_to_axis` with the axis vector and its length precomputed."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rel = (dy * (xt - x1) - dx * (yt - y1)) / denom
+    bad = (denom < eps) | ~np.isfinite(denom) | ~np.isfinite(rel)
+    return np.where(bad, np.nan, rel)
+
+
+class MetricsContext:
+    """
+    Per-frame body-axis quantities for one clp1 → clp2 pair, computed once and shared by
+    every metric measured against that axis (fin angles, yaw, tail angle/side/furthest point).
+
+    The module-level ``calc_*`` functions build a throwaway context per call; a pipeline that
+    runs several of them on the same frames should build one and call its methods instead.
+
+    Args:
+        clp1 (dict): First axis point coordinates ('x'/'y' arrays or a PointArray).
+        clp2 (dict): Second axis point coordinates.
+        n (int, optional): Frame count; defaults to the length of ``clp1``.
+        dtype: Working float type for inputs and results. ``np.float32`` halves memory
+            traffic on long recordings (about a third faster) but is only good to roughly
+            1e-3°; the default float64 matches the ``calc_*`` functions exactly.
+    """
+
+    def __init__(self, clp1, clp2, n=None, dtype=float):
+        self.n = len(clp1["x"]) if n is None else n
+        self.dtype = np.dtype(dtype)
+        self.x1, self.y1 = _xy(clp1, self.n, self.dtype)
+        self.x2, self.y2 = _xy(clp2, self.n, self.dtype)
+        self.vx = self.x2 - self.x1
+        self.vy = self.y2 - self.y1
+        self.norm = np.hypot(self.vx, self.vy)
+        # arctan2 already yields NaN wherever either delta is NaN.
+        self.heading = np.arctan2(self.vy, self.vx)
+
+    def fin_angle(self, fin_points_arr, left_fin=False):
+        """See :func:`calc_fin_angle`."""
+        if not fin_points_arr:
+            return np.full(self.n, np.nan, dtype=self.dtype)
+        bx, by = _xy(fin_points_arr[0], self.n, self.dtype)
+        tx, ty = _xy(fin_points_arr[-1], self.n, self.dtype)
+        # Fin directions for every frame at once; NaN coords propagate to NaN angles.
+        angle_deg = np.degrees(np.arctan2(ty - by, tx - bx) - self.heading)
+        angle_deg = np.where(
+            angle_deg < -180, angle_deg + 360, np.where(angle_deg > 180, angle_deg - 360, angle_deg)
+        )
+        return angle_deg if left_fin else -angle_deg
+
+    def yaw(self):
+        """See :func:`calc_yaw`."""
+        return -np.degrees(self.heading)
+
+    def tail_angle(self, tp):
+        """See :func:`calc_tail_angle` (vertex at clp2, so its first ray is the reversed axis)."""
+        xt, yt = _xy(tp, self.n, self.dtype)
+        return _ray_angles(-self.vx, -self.vy, self.norm, xt - self.x2, yt - self.y2)
+
+    def _offsets(self, xt, yt):
+        return _signed_offsets(self.x1, self.y1, self.vx, self.vy, self.norm, xt, yt)
+
+    def tail_side_and_distance(self, tp, scale_factor):
+        """See :func:`calc_tail_side_and_distance`."""
+        distances_raw = self._offsets(*_xy(tp, self.n, self.dtype))
+        # NaN offsets compare False both ways, so they fall through to "On the line" like exact zeros.
+        sides = np.where(
+            distances_raw < 0, "Right", np.where(distances_raw > 0, "Left", "On the line")
+        ).astype(object)
+        distances_scaled = distances_raw * scale_factor
+        return sides, distances_scaled, distances_raw
+
+    def furthest_tail_point(self, tail, tail_points):
+        """See :func:`calc_furthest_tail_point`."""
+        txs, tys = (np.stack(c) for c in zip(*(_xy(pt, self.n, self.dtype) for pt in tail)))
+        # (tail points, frames) offsets; the axis rows broadcast across every tail point.
+        offsets = np.abs(self._offsets(txs, tys))
+        # NaN offsets never win, and argmax keeps the first of equal maxima; a frame with no
+        # positive offset falls back to tail_points[0].
+        furthest_idx = np.argmax(np.nan_to_num(offsets, nan=0.0), axis=0)
+        return np.asarray(tail_points, dtype=object)[furthest_idx]
 
 
 def calc_tail_side_and_distance(clp1, clp2, tp, scale_factor):
@@ -242,27 +362,7 @@ def calc_tail_side_and_distance(clp1, clp2, tp, scale_factor):
             - distances_scaled: Array of signed distances scaled into real units.
             - distances_raw: Array of signed distances in pixel units.
     """
-    n = len(tp["x"])
-    sides = np.array([""] * n, dtype=object)
-    distances_scaled = np.full(n, np.nan)
-    distances_raw = np.full(n, np.nan)
-    for i in range(n):
-        x1, y1 = clp1["x"][i], clp1["y"][i]
-        x2, y2 = clp2["x"][i], clp2["y"][i]
-        xt, yt = tp["x"][i], tp["y"][i]
-        rel_pos = _signed_perp_distance_to_axis(x1, y1, x2, y2, xt, yt)
-        signed_dist = rel_pos * scale_factor
-        if not np.isfinite(rel_pos):
-            sides[i] = "On the line"
-        elif rel_pos < 0:
-            sides[i] = "Right"
-        elif rel_pos > 0:
-            sides[i] = "Left"
-        else:
-            sides[i] = "On the line"
-        distances_scaled[i] = signed_dist if np.isfinite(rel_pos) else np.nan
-        distances_raw[i] = rel_pos
-    return sides, distances_scaled, distances_raw
+    return MetricsContext(clp1, clp2, len(tp["x"])).tail_side_and_distance(tp, scale_factor)
 
 
 def calc_furthest_tail_point(clp1, clp2, tail, tail_points):
@@ -278,23 +378,91 @@ def calc_furthest_tail_point(clp1, clp2, tail, tail_points):
     Returns:
         np.ndarray: Array of tail point names corresponding to the furthest points per frame.
     """
-    n = len(tail[0]["x"])
-    furthest_pt = np.empty(n, dtype=object)
-    for i in range(n):
-        x1, y1 = clp1["x"][i], clp1["y"][i]
-        x2, y2 = clp2["x"][i], clp2["y"][i]
-        max_abs_dist = 0.0
-        furthest = tail_points[0]
-        for p, pt in enumerate(tail):
-            xt, yt = pt["x"][i], pt["y"][i]
-            rel_pos = _signed_perp_distance_to_axis(x1, y1, x2, y2, xt, yt)
-            if not np.isfinite(rel_pos):
-                continue
-            if abs(rel_pos) > max_abs_dist:
-                max_abs_dist = abs(rel_pos)
-                furthest = tail_points[p]
-        furthest_pt[i] = furthest
-    return furthest_pt
+    return MetricsContext(clp1, clp2, len(tail[0]["x"])).furthest_tail_point(tail, tail_points)
+
+
+def _peak_codes_numpy(angles, buffer):
+    n = len(angles)
+    codes = np.zeros(n, dtype=np.int8)
+    width = 2 * buffer + 1
+    if n < width:
+        return codes
+    # One row per candidate frame: its full [i-buffer, i+buffer] window (a strided view, no copy).
+    windows = sliding_window_view(angles, width)
+    center = windows[:, buffer:buffer + 1]
+    valid = ~np.isnan(windows).any(axis=1)
+    # Ties count (>= / <=), as before: a flat window is a "max".
+    is_max = valid & (center >= windows).all(axis=1)
+    is_min = valid & ~is_max & (center <= windows).all(axis=1)
+    codes[buffer:n - buffer] = is_max.view(np.int8) - is_min.view(np.int8)
+    return codes
+
+
+def _peak_codes_loop(angles, buffer):
+    # Same rules as _peak_codes_numpy, one window at a time without temporaries (for numba).
+    n = len(angles)
+    codes = np.zeros(n, dtype=np.int8)
+    for i in range(buffer, n - buffer):
+        c = angles[i]
+        is_max = True
+        is_min = True
+        valid = True
+        for j in range(i - buffer, i + buffer + 1):
+            v = angles[j]
+            if np.isnan(v):
+                valid = False
+                break
+            if c < v:
+                is_max = False
+            if c > v:
+                is_min = False
+        if valid:
+            if is_max:
+                codes[i] = 1
+            elif is_min:
+                codes[i] = -1
+    return codes
+
+
+def _run_extremes_numpy(vals, beyond, pick_max):
+    # Excursions are runs of ``beyond``.
+    edges = np.diff(np.concatenate(([0], beyond.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    pick = np.argmax if pick_max else np.argmin
+    return np.array([s + pick(vals[s:e]) for s, e in zip(starts, ends)], dtype=np.int64)
+
+
+def _run_extremes_loop(vals, beyond, pick_max):
+    # Same rules as _run_extremes_numpy in a single scan (for numba).
+    n = len(vals)
+    out = np.empty(n, dtype=np.int64)
+    k = 0
+    i = 0
+    while i < n:
+        if not beyond[i]:
+            i += 1
+            continue
+        best = i
+        i += 1
+        while i < n and beyond[i]:
+            if (vals[i] > vals[best]) if pick_max else (vals[i] < vals[best]):
+                best = i
+            i += 1
+        out[k] = best
+        k += 1
+    return out[:k]
+
+
+if _njit is not None:
+    _peak_codes = _njit(cache=True, boundscheck=False)(_peak_codes_loop)
+    _run_extremes = _njit(cache=True, boundscheck=False)(_run_extremes_loop)
+else:
+    _peak_codes = _peak_codes_numpy
+    _run_extremes = _run_extremes_numpy
+
+# Indexed by peak code + 1 (-1 min, 0 none, 1 max).
+_PEAK_LABELS = np.array(["min", "", "max"], dtype=object)
 
 
 def detect_fin_peaks(angles, buffer):
@@ -308,56 +476,30 @@ def detect_fin_peaks(angles, buffer):
     Returns:
         np.ndarray: Array of "max", "min", or empty strings per frame.
     """
-    n = len(angles)
-    peaks = np.array([""] * n, dtype=object)
-    for i in range(buffer, n - buffer):
-        segment = angles[i-buffer: i+buffer+1]
-        if np.isnan(segment).any():
-            continue
-        current = angles[i]
-        left = angles[i-buffer:i]
-        right = angles[i+1:i+buffer+1]
-        if np.all(current >= left) and np.all(current >= right):
-            peaks[i] = "max"
-        elif np.all(current <= left) and np.all(current <= right):
-            peaks[i] = "min"
-    return peaks
+    angles = np.ascontiguousarray(angles, dtype=float)
+    return _PEAK_LABELS[_peak_codes(angles, int(buffer)) + 1]
 
 
 def _get_peaks(values, cutoff, total_range, negative=False):
-    peaks = []
-    on_peak = False
-    current_pos = 0
-    current_extreme = 0
-    for i in range(total_range):
-        val = values[i]
-        if np.isnan(val):
-            continue
-        if negative:
-            if not on_peak and val < cutoff:
-                current_pos = i
-                current_extreme = val
-                on_peak = True
-            elif on_peak and val >= cutoff:
-                peaks.append(current_pos)
-                on_peak = False
-            elif on_peak and val < current_extreme:
-                current_extreme = val
-                current_pos = i
-        else:
-            if not on_peak and val > cutoff:
-                current_pos = i
-                current_extreme = val
-                on_peak = True
-            elif on_peak and val <= cutoff:
-                peaks.append(current_pos)
-                on_peak = False
-            elif on_peak and val > current_extreme:
-                current_extreme = val
-                current_pos = i
-    if on_peak:
-        peaks.append(current_pos)
-    return peaks
+    """
+    Frame index of each excursion's extreme beyond ``cutoff`` (above it, or below it when
+    ``negative``). NaN frames are skipped: they neither end an excursion nor count in it.
+    Ties keep the first extreme frame; an excursion still open at the end is included.
+    """
+    values = np.asarray(values, dtype=float)[:total_range]
+    frames = np.flatnonzero(~np.isnan(values))
+    vals = values[frames]
+    beyond = vals < cutoff if negative else vals > cutoff
+    return frames[_run_extremes(vals, beyond, not negative)].tolist()
+
+
+def _last_peak_per_frame(peaks, n, initial):
+    """Most recent peak frame at or before each frame (``initial`` before the first peak)."""
+    last = np.full(n, -1, dtype=np.int64)
+    last[np.asarray(peaks, dtype=np.int64)] = peaks
+    last = np.maximum.accumulate(last) if n else last
+    last[last < 0] = initial
+    return last
 
 
 def get_time_ranges(left_fin_angles, right_fin_angles, tail_distances, config, n_frames):
@@ -387,70 +529,38 @@ def get_time_ranges(left_fin_angles, right_fin_angles, tail_distances, config, n
     tail_neg_peaks = _get_peaks(tail_distances, cutoff["tail_angle"], total_range, negative=True)
     tail_peaks = sorted(tail_pos_peaks + tail_neg_peaks)
 
-    left_peak_set = set(left_peaks)
-    right_peak_set = set(right_peaks)
-    tail_peak_set = set(tail_peaks)
+    init = -movement_span * 2
+    last_left = _last_peak_per_frame(left_peaks, total_range, init)
+    last_right = _last_peak_per_frame(right_peaks, total_range, init)
+    last_tail = _last_peak_per_frame(tail_peaks, total_range, init)
+
+    # A frame is "active" when every tracked signal peaked within movement_span frames; each
+    # maximal run of active frames is one bout.
+    frames = np.arange(total_range)
+    active = (frames - last_left <= movement_span) & (frames - last_right <= movement_span)
+    if use_tail:
+        active &= frames - last_tail <= movement_span
+        first_peak = np.minimum(np.minimum(last_left, last_right), last_tail)
+        latest_peak = np.maximum(np.maximum(last_left, last_right), last_tail)
+        end_cap = total_range
+    else:
+        first_peak = np.minimum(last_left, last_right)
+        latest_peak = np.maximum(last_left, last_right)
+        end_cap = total_range - 1
+    edges = np.diff(np.concatenate(([0], active.view(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)  # first inactive frame (== total_range if still open)
 
-    last_left = last_right = last_tail = -movement_span * 2
-    on_range = False
-    range_start = 0
     ranges = []
-
-    for i in range(total_range):
-        if i in left_peak_set:
-            last_left = i
-        if i in right_peak_set:
-            last_right = i
-        if i in tail_peak_set:
-            last_tail = i
-
-        if use_tail:
-            should_start = (
-                not on_range
-                and i - last_left <= movement_span
-                and i - last_right <= movement_span
-                and i - last_tail <= movement_span
-            )
-            should_end = (
-                on_range
-                and (
-                    i - last_left > movement_span
-                    or i - last_right > movement_span
-                    or i - last_tail > movement_span
-                )
-            )
-            if should_start:
-                earliest_peak = min(last_left, last_right, last_tail)
-                range_start = max(earliest_peak - swim_bout_buffer + swim_bout_shift, 0)
-                on_range = True
-            elif should_end:
-                latest_peak = max(last_left, last_right, last_tail)
-                range_end = min(latest_peak + swim_bout_buffer + swim_bout_shift, total_range)
-                ranges.append([range_start, range_end])
-                on_range = False
+    for start_i, end_i in zip(run_starts, run_ends):
+        range_start = max(int(first_peak[start_i]) - swim_bout_buffer + swim_bout_shift, 0)
+        if end_i < total_range:
+            # Closed at the first inactive frame, using the peaks seen up to that frame.
+            range_end = min(int(latest_peak[end_i]) + swim_bout_buffer + swim_bout_shift, end_cap)
         else:
-            should_start = (
-                not on_range
-                and i - last_left <= movement_span
-                and i - last_right <= movement_span
-            )
-            should_end = (
-                on_range
-                and (i - last_left > movement_span or i - last_right > movement_span)
-            )
-            if should_start:
-                earliest_peak = min(last_left, last_right)
-                range_start = max(earliest_peak - swim_bout_buffer + swim_bout_shift, 0)
-                on_range = True
-            elif should_end:
-                latest_peak = max(last_left, last_right)
-                range_end = min(latest_peak + swim_bout_buffer + swim_bout_shift, total_range - 1)
-                ranges.append([range_start, range_end])
-                on_range = False
-
-    if on_range:
-        latest_peak = max(last_left, last_right)
-        range_end = min(latest_peak + swim_bout_buffer + swim_bout_shift, total_range - 1)
+            # Still open after the last frame: closed from the fin peaks only.
+            last_fin_peak = max(int(last_left[-1]), int(last_right[-1]))
+            range_end = min(last_fin_peak + swim_bout_buffer + swim_bout_shift, total_range - 1)
         ranges.append([range_start, range_end])
 
     if len(ranges) <= 1:
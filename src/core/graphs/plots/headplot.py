@@ -83,11 +83,18 @@ def render_headplot(bundle: GraphDataBundle, ctx: Optional[OutputContext] = None
         )
     )
 
-    # Optional: shade bout ranges if present
-    for start, end in time_ranges:
-        fig.add_vrect(x0=start, x1=end, fillcolor="LightSkyBlue", opacity=0.2, line_width=0)
+    # Optional: shade bout ranges if present. Same shapes add_vrect would make, but set in
+    # one layout update: add_vrect revalidates every existing shape on each call.
+    bout_shapes = [
+        dict(
+            type="rect", xref="x", yref="y domain", x0=start, x1=end, y0=0, y1=1,
+            fillcolor="LightSkyBlue", opacity=0.2, line=dict(width=0),
+        )
+        for start, end in time_ranges
+    ]
 
     fig.update_layout(
+        shapes=bout_shapes,
         title="Head Orientation (Head Yaw) Over Time",
         xaxis_title="Frame",
         yaxis_title="Head Yaw (deg)",
@@ -10,7 +10,7 @@ from __future__ import annotations
 import math
 import os
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import plotly.graph_objects as go
 import plotly.io as pio
@@ -333,8 +333,13 @@ def _build_spine_traces(
     total_spines: int,
     draw_with_gradient: bool,
     mult_spine_gradient: bool,
-) -> Tuple[List[go.Scatter], Tuple[float, float, float, float]]:
-    """Create Plotly traces for a single spine frame and return its bounding box."""
+) -> Tuple[List[Dict[str, Any]], Tuple[float, float, float, float]]:
+    """
+    Create Plotly scatter trace specs for a single spine frame and return its bounding box.
+
+    Specs are plain dicts: the figure validates each trace once when it is added, whereas a
+    ``go.Scatter`` built here would be validated here and then copied and validated again.
+    """
     if not points:
         return [], (0, 0, 0, 0)
 
@@ -357,7 +362,7 @@ def _build_spine_traces(
 
     bbox = (min(xs), max(xs), min(ys), max(ys))
 
-    traces: List[go.Scatter] = []
+    traces: List[Dict[str, Any]] = []
     base_color = PALETTE[spine_idx % len(PALETTE)]
 
     for i in range(len(xs) - 1):
@@ -372,7 +377,8 @@ def _build_spine_traces(
             color = base_color
         rgb_str = f"rgb({int(color[0] * 255)}, {int(color[1] * 255)}, {int(color[2] * 255)})"
         traces.append(
-            go.Scatter(
+            dict(
+                type="scatter",
                 x=xs[i : i + 2],
                 y=ys[i : i + 2],
                 mode="lines",
@@ -430,14 +436,16 @@ def _render_figures(
 
             offset = 0.0
             bboxes: List[Tuple[float, float, float, float]] = []
+            bout_traces: List[Dict[str, Any]] = []
             for spine_idx, (frame_idx, pts, _) in enumerate(frames):
                 traces, bbox = _build_spine_traces(
                     pts, offset, spine_idx, len(frames), draw_with_gradient, mult_spine_gradient
                 )
-                for trace in traces:
-                    fig.add_trace(trace)
+                bout_traces.extend(traces)
                 bboxes.append(bbox)
                 offset += plot_draw_offset
+            # One add_traces per figure: each add_trace call re-copies every trace already added.
+            fig.add_traces(bout_traces)
 
             for i in range(len(bboxes)):
                 for j in range(i + 1, len(bboxes)):
@@ -456,14 +464,20 @@ def _render_figures(
         for bout_idx, frames in enumerate(per_bout_frames):
             offset = 0.0
             bboxes: List[Tuple[float, float, float, float]] = []
+            bout_traces: List[Dict[str, Any]] = []
             for spine_idx, (frame_idx, pts, _) in enumerate(frames):
                 traces, bbox = _build_spine_traces(
                     pts, offset, spine_idx, len(frames), draw_with_gradient, mult_spine_gradient
                 )
-                for trace in traces:
-                    fig.add_trace(trace, row=bout_idx + 1, col=1)
+                bout_traces.extend(traces)
                 bboxes.append(bbox)
                 offset += plot_draw_offset
+            if bout_traces:
+                fig.add_traces(
+                    bout_traces,
+                    rows=[bout_idx + 1] * len(bout_traces),
+                    cols=[1] * len(bout_traces),
+                )
 
             fig.update_yaxes(
                 scaleanchor="x",
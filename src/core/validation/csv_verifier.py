@@ -1,6 +1,59 @@
+import csv
 import os
+import re
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
+# scorer / bodyparts / coords
+_DLC_HEADER_ROWS = 3
+
+# Whole coords row (scorer column dropped) for the two accepted per-bodypart layouts.
+_COORDS_FULL_RE = re.compile(r"x,y,likelihood(?:,x,y,likelihood)*")
+_COORDS_XY_RE = re.compile(r"x,y(?:,x,y)*")
+
+
+def _is_uniform_layout(bodyparts, coords):
+    """
+    True when every bodypart owns exactly one consecutive ``x,y,likelihood`` (or ``x,y``)
+    block and all blocks share that layout, checked with one regex match plus slice
+    comparisons; anything else goes through the per-column check for exact messages.
+    """
+    joined = ",".join(coords)
+    if _COORDS_FULL_RE.fullmatch(joined):
+        width = 3
+    elif _COORDS_XY_RE.fullmatch(joined):
+        width = 2
+    else:
+        return False
+    names = bodyparts[::width]
+    return len(set(names)) == len(names) and all(
+        bodyparts[offset::width] == names for offset in range(1, width)
+    )
+
+
+def _read_header_rows(file_path):
+    """
+    Return the three DLC header rows (each padded to the scorer row's width) and the number
+    of raw lines they span, without touching the data body.
+    """
+    rows = []
+    with open(file_path, newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        for row in reader:
+            if not row:
+                continue  # blank line; pandas skips these too
+            rows.append(row)
+            if len(rows) == _DLC_HEADER_ROWS:
+                width = len(rows[0])
+                return [r + [""] * (width - len(r)) for r in rows], reader.line_num
+    if not rows:
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+    raise ValueError(
+        f"Expected {_DLC_HEADER_ROWS} DeepLabCut header rows, found {len(rows)}"
+    )
+
 
 def verify_deeplabcut_csv(file_path, img_width=None, img_height=None):
 
@@ -17,54 +70,73 @@ def verify_deeplabcut_csv(file_path, img_width=None, img_height=None):
         errors.append(f"[ERROR] File is not a CSV: {file_path}")
         return errors, warnings
 
-    # Load file
-    df = pd.read_csv(file_path)
-
-    # Extract header rows
-    bodyparts = df.iloc[0]
-    coords = df.iloc[1]
+    # Header rows only: a malformed layout is reported without parsing the data body.
+    (_scorer, bodyparts, coords), n_header_lines = _read_header_rows(file_path)
+    bodyparts, coords = bodyparts[1:], coords[1:]
 
     # 1. Column structure check
-    bp_groups = {}
-    for col, bp, coord in zip(df.columns[1:], bodyparts[1:], coords[1:]):
-        bp_groups.setdefault(bp, []).append(coord)
-
-    for bp, coord_list in bp_groups.items():
-        expected_full = ["x", "y", "likelihood"]
-        expected_xy = ["x", "y"]
-        if coord_list not in (expected_full, expected_xy):
-            errors.append(
-                f"[ERROR] Bodypart '{bp}' has wrong columns: {coord_list}")
+    if not _is_uniform_layout(bodyparts, coords):
+        bp_groups = {}
+        for bp, coord in zip(bodyparts, coords):
+            bp_groups.setdefault(bp, []).append(coord)
+
+        for bp, coord_list in bp_groups.items():
+            expected_full = ["x", "y", "likelihood"]
+            expected_xy = ["x", "y"]
+            if coord_list not in (expected_full, expected_xy):
+                errors.append(
+                    f"[ERROR] Bodypart '{bp}' has wrong columns: {coord_list}")
+        if errors:
+            return errors, warnings
 
     # 2. Data validity check
-    data = df.iloc[2:].copy()
-    for col, bp, coord in zip(df.columns[1:], bodyparts[1:], coords[1:]):
-        vals = pd.to_numeric(data[col], errors="coerce")
-
+    data = pd.read_csv(
+        file_path,
+        header=None,
+        skiprows=n_header_lines,
+        names=range(len(bodyparts) + 1),
+        index_col=False,
+    )
+    # One numeric pass over the whole body; each check reduces to a per-column flag.
+    values = (
+        data.iloc[:, 1:].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    )
+    non_numeric = np.isnan(values).any(axis=0)
+    below_zero = (values < 0).any(axis=0)
+    above_one = (values > 1).any(axis=0)
+    x_out = below_zero | (values > img_width).any(axis=0) if img_width else None
+    y_out = below_zero | (values > img_height).any(axis=0) if img_height else None
+
+    for i, (bp, coord) in enumerate(zip(bodyparts, coords)):
         if coord in ["x", "y"]:
-            if vals.isna().any():
+            if non_numeric[i]:
                 errors.append(f"[ERROR] Non-numeric values in {bp}-{coord}")
-            if img_width and coord == "x":
-                if ((vals < 0) | (vals > img_width)).any():
-                    warnings.append(f"[WARN] Values out of range in {bp}-x")
-            if img_height and coord == "y":
-                if ((vals < 0) | (vals > img_height)).any():
-                    errors.append(f"[ERROR] Values out of range in {bp}-y")
+            if x_out is not None and coord == "x" and x_out[i]:
+                warnings.append(f"[WARN] Values out of range in {bp}-x")
+            if y_out is not None and coord == "y" and y_out[i]:
+                errors.append(f"[ERROR] Values out of range in {bp}-y")
         elif coord == "likelihood":
-            if ((vals < 0) | (vals > 1)).any():
+            if below_zero[i] or above_one[i]:
                 warnings.append(f"[WARN] Likelihood out of [0,1] for {bp}")
 
     return errors, warnings
 
 
-def list_bodyparts(file_path):
-    # Load the CSV
-    df = pd.read_csv(file_path)
+@lru_cache(maxsize=128)
+def _list_bodyparts_cached(file_path, _mtime_ns, _size):
+    # The stat fields only key the cache: an edited file gets a fresh entry.
+    # Header rows only; the data body is never read.
+    (_scorer, bodyparts, _coords), _ = _read_header_rows(file_path)
 
-    # First row contains bodypart names
-    bodyparts = df.iloc[0, 1:].unique()  # skip first col (scorer)
+    # Second row contains bodypart names
+    return pd.unique(pd.Series(bodyparts[1:], dtype=object))  # skip first col
 
-    return bodyparts
+
+def list_bodyparts(file_path):
+    """Unique bodypart names in first-appearance order; cached per (path, mtime, size)."""
+    st = os.stat(file_path)
+    # Copy so callers can't mutate the cached array.
+    return _list_bodyparts_cached(file_path, st.st_mtime_ns, st.st_size).copy()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 from os import path
 import json
+import logging
 import shutil
 from pathlib import Path
 
 from PyQt5.QtCore import pyqtSignal, QObject
-from PyQt5.QtWidgets import QMessageBox
 
 from app_platform.paths import (
     SESSION_JSON_FILENAME,
@@ -14,6 +14,9 @@ from app_platform.paths import (
     sessions_dir,
 )
 
+log = logging.getLogger(__name__)
+
+
 class Session(QObject):
     session_updated = pyqtSignal()
 
@@ -36,6 +39,8 @@ class Session(QObject):
         self.last_config_path = None
         # user-picked path -> canonical key under sessions/.../uploads (backlog #3)
         self._import_alias_by_user: dict[str, str] = {}
+        # Cached has_any_config() answer; None means "rescan csvs" (reset by every mutator).
+        self._has_any_config: bool | None = None
 
     def _resolve_csv_key(self, csv_path: str) -> str:
         if not csv_path:
@@ -81,7 +86,7 @@ class Session(QObject):
         try:
             shutil.copy2(str(src), str(dest))
         except OSError as e:
-            print(f"[Session] Could not copy CSV into session: {e}")
+            log.warning("[Session] Could not copy CSV into session: %s", e)
             return str(src)
         return str(dest)
 
@@ -93,7 +98,7 @@ class Session(QObject):
         use the path string as stored in the JSON without copying.
         """
         if not path.exists(csv_path):
-            print(f"[Session] CSV path does not exist: {csv_path}")
+            log.warning("[Session] CSV path does not exist: %s", csv_path)
             return
 
         if session_import:
@@ -107,6 +112,7 @@ class Session(QObject):
         # wipe any configs/graphs already attached to it (losing progress).
         if key not in self.csvs:
             self.csvs[key] = {}
+            self._has_any_config = None
         if session_import and orig != key and orig not in self._import_alias_by_user:
             self._import_alias_by_user[orig] = key
         self.session_updated.emit()
@@ -114,13 +120,14 @@ class Session(QObject):
     def addCSVFolder(self, folder_path: str, csv_files: list[str]):
         """Register a folder of CSVs as a single CSV input ID."""
         if not folder_path or not path.exists(folder_path):
-            print(f"[Session] Folder path does not exist: {folder_path}")
+            log.warning("[Session] Folder path does not exist: %s", folder_path)
             return
         # Store file list in stable order
         files = [f for f in (csv_files or []) if f and path.exists(f)]
         self.csv_folders[folder_path] = files
         if folder_path not in self.csvs:
             self.csvs[folder_path] = {}
+            self._has_any_config = None
         self.session_updated.emit()
 
     def is_folder_csv(self, csv_id: str) -> bool:
@@ -134,7 +141,7 @@ class Session(QObject):
         if not folder_path or not config_path or not csv_file_path or not graph_asset_path:
             return
         if not path.exists(graph_asset_path):
-            print(f"[Session] Graph asset path does not exist: {graph_asset_path}")
+            log.warning("[Session] Graph asset path does not exist: %s", graph_asset_path)
             return
 
         fg = self.folder_graphs.setdefault(folder_path, {})
@@ -150,7 +157,7 @@ class Session(QObject):
         
     def addConfigToCSV(self, csv_path, config_path):
         if not path.exists(config_path):
-            print(f"[Session] Config path does not exist: {config_path}")
+            log.warning("[Session] Config path does not exist: %s", config_path)
             return
 
         csv_path = self._resolve_csv_key(csv_path)
@@ -160,11 +167,12 @@ class Session(QObject):
 
         if config_path not in self.csvs[csv_path]:
             self.csvs[csv_path][config_path] = []
+            self._has_any_config = True
             self.session_updated.emit()
 
     def addGraphToConfig(self, config_path, graph_path):
         if not path.exists(graph_path):
-            print(f"[Session] Graph path does not exist: {graph_path}")
+            log.warning("[Session] Graph path does not exist: %s", graph_path)
             return
         
         for _, configs in self.csvs.items():
@@ -187,6 +195,12 @@ class Session(QObject):
             all_configs.extend(configs.keys())
         return all_configs
     
+    def has_any_config(self) -> bool:
+        """True if any CSV row has at least one config attached (cached between mutations)."""
+        if self._has_any_config is None:
+            self._has_any_config = any(bool(configs) for configs in (self.csvs or {}).values())
+        return self._has_any_config
+
     def getGraphsForConfig(self, config_path):
         for _, configs in self.csvs.items():
             if config_path in configs:
@@ -304,6 +318,7 @@ class Session(QObject):
         if not row or config_path not in row:
             return
         del row[config_path]
+        self._has_any_config = None
         fg = self.folder_graphs or {}
         if csv_path in fg and config_path in fg[csv_path]:
             del fg[csv_path][config_path]
@@ -321,6 +336,7 @@ class Session(QObject):
             return
         if csv_path in self.csvs:
             del self.csvs[csv_path]
+            self._has_any_config = None
         cf = self.csv_folders or {}
         if csv_path in cf:
             del self.csv_folders[csv_path]
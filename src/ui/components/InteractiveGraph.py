@@ -9,7 +9,7 @@ QtWebEngineWidgets is unavailable.
 
 Usage
 -----
-    from src.ui.components.InteractiveGraph import InteractiveGraph
+    from ui.components.InteractiveGraph import InteractiveGraph
 
     widget = InteractiveGraph(parent)
     widget.set_figure(fig)          # fig is a plotly go.Figure
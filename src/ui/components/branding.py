@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import QLabel
 
 from app_platform.paths import images_dir
@@ -30,15 +31,27 @@ def view_output_tool_icon(theme_name: str, *, active: bool = True) -> Optional[Q
     return None
 
 
+def scaled_pixmap(path: Path, w: int, h: int) -> QPixmap:
+    """``path`` scaled to fit w×h, shared through ``QPixmapCache`` (null pixmap if unreadable)."""
+    key = f"{path}:{w}x{h}"
+    pm = QPixmapCache.find(key)
+    if pm is not None and not pm.isNull():
+        return pm
+    pm = QPixmap(str(path))
+    if pm.isNull():
+        return pm
+    pm = pm.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(key, pm)
+    return pm
+
+
 def fish_pixmap(square_size: int) -> QPixmap:
     """Scaled square pixmap of the zebrafish logo, or a gray fallback."""
-    path = images_dir() / "fish1.png"
-    pm = QPixmap(str(path))
+    pm = scaled_pixmap(images_dir() / "fish1.png", square_size, square_size)
     if pm.isNull():
         pm = QPixmap(square_size, square_size)
         pm.fill(Qt.gray)
-        return pm
-    return pm.scaled(square_size, square_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return pm
 
 
 def title_bar_logo_label(size: int = 28) -> QLabel:
@@ -1,6 +1,13 @@
-from PyQt5.QtCore import QSize, Qt, pyqtSignal
+from PyQt5.QtCore import QSize, Qt, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import QStyle, QToolButton, QVBoxLayout, QWidget
+from PyQt5.QtWidgets import (
+    QAbstractButton,
+    QButtonGroup,
+    QStyle,
+    QToolButton,
+    QVBoxLayout,
+    QWidget,
+)
 
 from app_platform.paths import images_dir
 
@@ -44,6 +51,10 @@ class SidebarTools(QWidget):
         ]
         self._main_buttons: list[QToolButton] = []
         self._buttons_by_key: dict[str, QToolButton] = {}
+        # One connection for all tool buttons; the key rides on the ``toolKey`` property.
+        self._tool_group = QButtonGroup(self)
+        self._tool_group.setExclusive(False)
+        self._tool_group.buttonClicked.connect(self._on_tool_button_clicked)
         for key, tip in spec:
             btn = QToolButton()
             btn.setObjectName("SidebarTool")
@@ -54,7 +65,7 @@ class SidebarTools(QWidget):
             btn.setCursor(Qt.PointingHandCursor)
             btn.setAutoRaise(True)
             btn.setMinimumSize(QSize(46, 46))
-            btn.clicked.connect(lambda _checked=False, k=key: self.tool_triggered.emit(k))
+            self._tool_group.addButton(btn)
             layout.addWidget(btn, 0, Qt.AlignHCenter)
             self._main_buttons.append(btn)
             self._buttons_by_key[key] = btn
@@ -73,6 +84,12 @@ class SidebarTools(QWidget):
         self._settings_btn.clicked.connect(self.settings_requested.emit)
         layout.addWidget(self._settings_btn, 0, Qt.AlignHCenter)
 
+    @pyqtSlot(QAbstractButton)
+    def _on_tool_button_clicked(self, btn: QAbstractButton) -> None:
+        key = btn.property("toolKey")
+        if key:
+            self.tool_triggered.emit(str(key))
+
     def _sidebar_svg_icon(self, key: str, enabled: bool) -> QIcon | None:
         theme = self._theme_name
         state = "active" if enabled else "inactive"
@@ -105,9 +122,7 @@ class SidebarTools(QWidget):
             if ic is None or ic.isNull():
                 ic = st.standardIcon(self._FALLBACK_STD[key])
             btn.setIcon(ic)
-            btn.setProperty("sidebarMuted", "true" if not active else "false")
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
+            self._set_style_property(btn, "sidebarMuted", "true" if not active else "false")
 
     def apply_session_capabilities(
         self,
@@ -133,17 +148,25 @@ class SidebarTools(QWidget):
         self._active_key = key
         for k, btn in self._buttons_by_key.items():
             is_active = key is not None and k == key
-            btn.setProperty("activeTool", "true" if is_active else "false")
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
+            self._set_style_property(btn, "activeTool", "true" if is_active else "false")
+
+    @staticmethod
+    def _set_style_property(btn: QToolButton, name: str, value: str) -> None:
+        """Set a QSS-selector property; re-polish only when the value actually changed."""
+        if btn.property(name) == value:
+            return
+        btn.setProperty(name, value)
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
 
     def reflect_theme(self, theme_name: str) -> None:
         self._theme_name = theme_name
         self._apply_tool_icons()
+        self.set_active_tool(self._active_key)
+        # The theme stylesheet itself changed, so every button needs one fresh polish.
         for btn in self._main_buttons:
             btn.style().unpolish(btn)
             btn.style().polish(btn)
-        self.set_active_tool(self._active_key)
         if hasattr(self, "_settings_btn"):
             self._settings_btn.style().unpolish(self._settings_btn)
             self._settings_btn.style().polish(self._settings_btn)
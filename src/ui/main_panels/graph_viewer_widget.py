@@ -1,4 +1,8 @@
 from __future__ import annotations
+import logging
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import re
@@ -36,20 +40,35 @@ from src.core.analysis.cross_correlation import (
 )
 from src.core.graphs.plots.crosscorr_plot import render_crosscorr_plot
 
-from src.ui.components.InteractiveGraph import InteractiveGraph
+from ui.components.InteractiveGraph import InteractiveGraph
 from src.core.calculations.cancelled import CalculationAborted
-from src.session import session
-from src.app_platform.paths import images_dir, sessions_dir
+from app_platform.paths import images_dir, sessions_dir
 
 from styles.ui_scale import scaled_px
 from ui.components.scene_help import create_scene_help_button
 from ui.components.wide_popup_combo import WidePopupComboBox
 from ui.workers.folder_graph_save_worker import run_folder_graph_save_core
 
+log = logging.getLogger(__name__)
+
 FOLDER_ICON = images_dir() / "folder-black.svg"
 
 GraphSource = Any  # go.Figure or a saved image path (str/Path)
 
+# Rasterized compare-pane sources kept per scene (LRU); Kaleido renders take ~1 s each.
+PIXMAP_CACHE_MAX = 32
+
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Block signals on ``widgets`` for the ``with`` body; restores each prior state, even on error."""
+    prev = [w.blockSignals(True) for w in widgets]
+    try:
+        yield
+    finally:
+        for w, was_blocked in zip(widgets, prev):
+            w.blockSignals(was_blocked)
+
 
 def count_figures_in_graph_dict(graphs: Optional[Dict[str, Any]]) -> int:
     """How many `go.Figure` entries (each will be written to session disk when saving)."""
@@ -144,6 +163,8 @@ class GraphViewerScene(QWidget):
         self._data = None
         self.current_session = None
         self._kaleido_available = _is_kaleido_available()
+        # Compare-pane renders: key -> (figure or None for files, pixmap), LRU-capped
+        self._pixmap_cache: "OrderedDict[tuple, Tuple[Optional[go.Figure], QPixmap]]" = OrderedDict()
 
         # Cross-correlation state
         self._crosscorr_available = False
@@ -448,14 +469,15 @@ class GraphViewerScene(QWidget):
             self.tab_widget.setTabEnabled(self.TAB_COMPARE, False)
             return
         multi = len(paths) > 1
+        # Both CSV combos list ``paths`` in order, so one map restores either selection in O(1).
+        path_index = {p: i for i, p in enumerate(paths)}
         old_ca = self.compare_csv_a.currentData()
         old_cb = self.compare_csv_b.currentData()
         old_ga = self.compare_graph_a.currentData()
         old_gb = self.compare_graph_b.currentData()
         self._compare_syncing = True
-        try:
+        with _signals_blocked(self.compare_csv_a, self.compare_csv_b):
             for combo in (self.compare_csv_a, self.compare_csv_b):
-                combo.blockSignals(True)
                 combo.clear()
                 for p in paths:
                     combo.addItem(Path(p).name if p != "current" else "(current file)", p)
@@ -464,13 +486,10 @@ class GraphViewerScene(QWidget):
                 (self.compare_csv_a, old_ca, 0),
                 (self.compare_csv_b, old_cb, min(1, len(paths) - 1) if multi and len(paths) > 1 else 0),
             ):
-                if prev is not None and combo.findData(prev) >= 0:
-                    combo.setCurrentIndex(combo.findData(prev))
+                if prev is not None and prev in path_index:
+                    combo.setCurrentIndex(path_index[prev])
                 else:
                     combo.setCurrentIndex(min(fallback, max(0, combo.count() - 1)))
-        finally:
-            for combo in (self.compare_csv_a, self.compare_csv_b):
-                combo.blockSignals(False)
         pa = str(self.compare_csv_a.currentData() or "current")
         pb = str(self.compare_csv_b.currentData() or "current")
         self._fill_compare_graph_combo(
@@ -498,17 +517,16 @@ class GraphViewerScene(QWidget):
         self, combo: QComboBox, graph_dict: Dict[str, GraphSource], preferred_name: Optional[str] = None
     ) -> None:
         names = list(graph_dict.keys())
-        combo.blockSignals(True)
-        combo.clear()
-        for n in names:
-            combo.addItem(n, n)
-        if names:
-            if preferred_name and preferred_name in graph_dict:
-                i = next((k for k, n in enumerate(names) if n == preferred_name), 0)
-                combo.setCurrentIndex(i)
-            else:
-                combo.setCurrentIndex(0)
-        combo.blockSignals(False)
+        with _signals_blocked(combo):
+            combo.clear()
+            for n in names:
+                combo.addItem(n, n)
+            if names:
+                if preferred_name and preferred_name in graph_dict:
+                    i = next((k for k, n in enumerate(names) if n == preferred_name), 0)
+                    combo.setCurrentIndex(i)
+                else:
+                    combo.setCurrentIndex(0)
 
     def _on_compare_inputs_changed(self, *_args) -> None:
         if self._compare_syncing:
@@ -518,19 +536,37 @@ class GraphViewerScene(QWidget):
         self._update_compare_images()
 
     def _source_to_pixmap_safe(self, source: Optional[GraphSource]) -> Optional[QPixmap]:
+        """Cached :meth:`_render_source_pixmap`: flipping compare combos reuses earlier renders."""
         if source is None:
             return None
+        if isinstance(source, go.Figure):
+            # The figure itself is stored with the pixmap, so a recycled id() can't alias it.
+            key, owner = ("fig", id(source)), source
+        else:
+            try:
+                # mtime in the key: a re-saved PNG under the same name renders afresh
+                key, owner = ("path", str(source), os.stat(str(source)).st_mtime_ns), None
+            except OSError:
+                return None
+        hit = self._pixmap_cache.get(key)
+        if hit is not None and hit[0] is owner:
+            self._pixmap_cache.move_to_end(key)
+            return hit[1]
+        pix = self._render_source_pixmap(source)
+        if pix is not None:
+            self._pixmap_cache[key] = (owner, pix)
+            while len(self._pixmap_cache) > PIXMAP_CACHE_MAX:
+                self._pixmap_cache.popitem(last=False)
+        return pix
+
+    def _render_source_pixmap(self, source: GraphSource) -> Optional[QPixmap]:
         if isinstance(source, go.Figure):
             if not self._kaleido_available:
                 return None
             try:
-                png_bytes = pio.to_image(source, format="png", scale=2)
-                pix = QPixmap()
-                if pix.loadFromData(png_bytes) and not pix.isNull():
-                    return pix
+                return _plotly_figure_pixmap(source)
             except Exception:
                 return None
-            return None
         try:
             p = QPixmap(str(source))
             return p if not p.isNull() else None
@@ -671,17 +707,14 @@ class GraphViewerScene(QWidget):
         self._csv_order = []
         self._last_single_run_df = None
         try:
-            self.csv_combo.blockSignals(True)
-            self.csv_combo.clear()
-            self.csv_combo.setVisible(False)
-            self.csv_combo.blockSignals(False)
+            with _signals_blocked(self.csv_combo, self.crosscorr_csv_combo):
+                self.csv_combo.clear()
+                self.csv_combo.setVisible(False)
+                self.crosscorr_csv_combo.clear()
+                self.crosscorr_csv_combo.setVisible(False)
             self.csv_nav_row.setVisible(False)
             self.prev_csv_btn.setVisible(False)
             self.next_csv_btn.setVisible(False)
-            self.crosscorr_csv_combo.blockSignals(True)
-            self.crosscorr_csv_combo.clear()
-            self.crosscorr_csv_combo.setVisible(False)
-            self.crosscorr_csv_combo.blockSignals(False)
         except Exception:
             pass
 
@@ -743,10 +776,9 @@ class GraphViewerScene(QWidget):
         )
 
         if len(self._csv_order) <= 1:
-            self.crosscorr_csv_combo.blockSignals(True)
-            self.crosscorr_csv_combo.clear()
-            self.crosscorr_csv_combo.setVisible(False)
-            self.crosscorr_csv_combo.blockSignals(False)
+            with _signals_blocked(self.crosscorr_csv_combo):
+                self.crosscorr_csv_combo.clear()
+                self.crosscorr_csv_combo.setVisible(False)
             self.csv_nav_row.setVisible(False)
             self.prev_csv_btn.setVisible(False)
             self.next_csv_btn.setVisible(False)
@@ -764,20 +796,17 @@ class GraphViewerScene(QWidget):
             )
             return
 
-        self.csv_combo.blockSignals(True)
-        self.crosscorr_csv_combo.blockSignals(True)
-        self.csv_combo.clear()
-        self.crosscorr_csv_combo.clear()
-        for csv_path in self._csv_order:
-            label = Path(csv_path).name if csv_path else "(unknown)"
-            self.csv_combo.addItem(label, userData=csv_path)
-            self.crosscorr_csv_combo.addItem(label, userData=csv_path)
-        self.csv_combo.setVisible(True)
-        self.crosscorr_csv_combo.setVisible(bool(self._results_by_csv))
-        self.csv_combo.setCurrentIndex(0)
-        self.crosscorr_csv_combo.setCurrentIndex(0)
-        self.csv_combo.blockSignals(False)
-        self.crosscorr_csv_combo.blockSignals(False)
+        with _signals_blocked(self.csv_combo, self.crosscorr_csv_combo):
+            self.csv_combo.clear()
+            self.crosscorr_csv_combo.clear()
+            for csv_path in self._csv_order:
+                label = Path(csv_path).name if csv_path else "(unknown)"
+                self.csv_combo.addItem(label, userData=csv_path)
+                self.crosscorr_csv_combo.addItem(label, userData=csv_path)
+            self.csv_combo.setVisible(True)
+            self.crosscorr_csv_combo.setVisible(bool(self._results_by_csv))
+            self.csv_combo.setCurrentIndex(0)
+            self.crosscorr_csv_combo.setCurrentIndex(0)
 
         self.csv_nav_row.setVisible(True)
         self.prev_csv_btn.setVisible(True)
@@ -789,17 +818,15 @@ class GraphViewerScene(QWidget):
     def _on_csv_changed(self, _idx: int):
         self._update_csv_nav_buttons()
         if self.crosscorr_csv_combo.count() == self.csv_combo.count() and self.crosscorr_csv_combo.count() > 0:
-            self.crosscorr_csv_combo.blockSignals(True)
-            self.crosscorr_csv_combo.setCurrentIndex(self.csv_combo.currentIndex())
-            self.crosscorr_csv_combo.blockSignals(False)
+            with _signals_blocked(self.crosscorr_csv_combo):
+                self.crosscorr_csv_combo.setCurrentIndex(self.csv_combo.currentIndex())
         self._apply_selected_csv(config=None)
         self._apply_crosscorr_for_current_folder_csv()
 
     def _on_crosscorr_csv_changed(self, _idx: int) -> None:
         if self.csv_combo.count() == self.crosscorr_csv_combo.count() and self.csv_combo.count() > 0:
-            self.csv_combo.blockSignals(True)
-            self.csv_combo.setCurrentIndex(self.crosscorr_csv_combo.currentIndex())
-            self.csv_combo.blockSignals(False)
+            with _signals_blocked(self.csv_combo):
+                self.csv_combo.setCurrentIndex(self.crosscorr_csv_combo.currentIndex())
         self._update_csv_nav_buttons()
         self._apply_selected_csv(config=None)
         self._apply_crosscorr_for_current_folder_csv()
@@ -939,23 +966,10 @@ class GraphViewerScene(QWidget):
         graphs: Dict[str, GraphSource] = {}
         warnings: List[str] = []
 
-        dot_graphs, dot_warnings = build_dot_plot_graphs(results_df, config)
-        graphs.update(dot_graphs)
-        warnings.extend(dot_warnings)
-
-        fin_graphs, fin_warnings = build_fin_tail_graphs(results_df, config)
-        graphs.update(fin_graphs)
-        warnings.extend(fin_warnings)
-
-        spine_graphs, spine_warnings = build_spine_graphs(
-            results_df, config, data.get("parsed_points")
-        )
-        graphs.update(spine_graphs)
-        warnings.extend(spine_warnings)
-
-        head_graphs, head_warnings = build_head_plot_graphs(results_df, config)
-        graphs.update(head_graphs)
-        warnings.extend(head_warnings)
+        for name, fig in _iter_graphs(
+            results_df, config, data.get("parsed_points"), warnings
+        ):
+            graphs[name] = fig
 
         tooltip = "\n".join(warnings) if warnings else ""
         self.list.setToolTip(tooltip)
@@ -989,12 +1003,9 @@ class GraphViewerScene(QWidget):
         self._crosscorr_available = False
         self._current_df = None
         try:
-            self.signal_a_combo.blockSignals(True)
-            self.signal_b_combo.blockSignals(True)
-            self.signal_a_combo.clear()
-            self.signal_b_combo.clear()
-            self.signal_a_combo.blockSignals(False)
-            self.signal_b_combo.blockSignals(False)
+            with _signals_blocked(self.signal_a_combo, self.signal_b_combo):
+                self.signal_a_combo.clear()
+                self.signal_b_combo.clear()
         except Exception:
             pass
         self.tab_widget.setTabEnabled(self.TAB_CROSS, False)
@@ -1014,27 +1025,22 @@ class GraphViewerScene(QWidget):
             self._crosscorr_signals = signals
             self._current_df = df
 
-            self.signal_a_combo.blockSignals(True)
-            self.signal_b_combo.blockSignals(True)
+            with _signals_blocked(self.signal_a_combo, self.signal_b_combo):
+                self.signal_a_combo.clear()
+                self.signal_b_combo.clear()
 
-            self.signal_a_combo.clear()
-            self.signal_b_combo.clear()
+                self.signal_a_combo.addItems(signals)
+                self.signal_b_combo.addItems(signals)
 
-            self.signal_a_combo.addItems(signals)
-            self.signal_b_combo.addItems(signals)
-
-            if len(signals) >= 2:
-                self.signal_a_combo.setCurrentIndex(0)
-                self.signal_b_combo.setCurrentIndex(1)
-
-            self.signal_a_combo.blockSignals(False)
-            self.signal_b_combo.blockSignals(False)
+                if len(signals) >= 2:
+                    self.signal_a_combo.setCurrentIndex(0)
+                    self.signal_b_combo.setCurrentIndex(1)
 
             self.tab_widget.setTabEnabled(self.TAB_CROSS, True)
             self.compute_crosscorr_btn.setEnabled(True)
 
         except Exception as e:
-            print(f"[GraphViewerScene] Could not enable cross-correlation: {e}")
+            log.warning("[GraphViewerScene] Could not enable cross-correlation: %s", e)
             self._crosscorr_available = False
             self.tab_widget.setTabEnabled(self.TAB_CROSS, False)
             self.compute_crosscorr_btn.setEnabled(False)
@@ -1082,7 +1088,7 @@ class GraphViewerScene(QWidget):
 
         except Exception as e:
             self.crosscorr_label.setText(f"Error computing cross-correlation:\n{str(e)}")
-            print(f"[GraphViewerScene] Cross-correlation error: {e}")
+            log.warning("[GraphViewerScene] Cross-correlation error: %s", e)
 
     def _update_crosscorr_pixmap(self):
         if not hasattr(self, "_current_crosscorr_pixmap") or self._current_crosscorr_pixmap is None:
@@ -1175,20 +1181,18 @@ class GraphViewerScene(QWidget):
         self._data = None
         self._last_single_run_df = None
         try:
-            self.csv_combo.blockSignals(True)
-            self.csv_combo.clear()
-            self.csv_combo.setVisible(False)
-            self.csv_combo.blockSignals(False)
+            with _signals_blocked(self.csv_combo, self.crosscorr_csv_combo):
+                self.csv_combo.clear()
+                self.csv_combo.setVisible(False)
+                self.crosscorr_csv_combo.clear()
+                self.crosscorr_csv_combo.setVisible(False)
             self.csv_nav_row.setVisible(False)
             self.prev_csv_btn.setVisible(False)
             self.next_csv_btn.setVisible(False)
-            self.crosscorr_csv_combo.blockSignals(True)
-            self.crosscorr_csv_combo.clear()
-            self.crosscorr_csv_combo.setVisible(False)
-            self.crosscorr_csv_combo.blockSignals(False)
         except Exception:
             pass
         self._graphs.clear()
+        self._pixmap_cache.clear()
         self.list.clear()
         self._show_empty_state("No graphs available.")
         self.set_context(None, None, None)
@@ -1201,10 +1205,10 @@ class GraphViewerScene(QWidget):
             self.compare_label_b.setText("—")
             self.compare_label_a.setPixmap(QPixmap())
             self.compare_label_b.setPixmap(QPixmap())
-            for c in (self.compare_csv_a, self.compare_csv_b, self.compare_graph_a, self.compare_graph_b):
-                c.blockSignals(True)
-                c.clear()
-                c.blockSignals(False)
+            combos = (self.compare_csv_a, self.compare_csv_b, self.compare_graph_a, self.compare_graph_b)
+            with _signals_blocked(*combos):
+                for c in combos:
+                    c.clear()
         except Exception:
             pass
 
@@ -1370,10 +1374,7 @@ class GraphViewerScene(QWidget):
             )
             return None
         try:
-            png_bytes = pio.to_image(fig, format="png", scale=2)
-            pix = QPixmap()
-            pix.loadFromData(png_bytes)
-            return pix
+            return _plotly_figure_pixmap(fig)
         except Exception as e:
             self._show_empty_state(
                 "Failed to render Plotly Figure as a static image.\n"
@@ -1448,6 +1449,18 @@ def _as_numeric_array(series: pd.Series) -> np.ndarray:
     return numeric.to_numpy()
 
 
+def _plotly_figure_pixmap(fig: go.Figure) -> Optional[QPixmap]:
+    """
+    Rasterize ``fig`` through Kaleido (2× scale). Kaleido only hands back encoded images, so
+    the PNG is decoded straight from memory with the format named up front (no sniffing).
+    """
+    png_bytes = pio.to_image(fig, format="png", scale=2)
+    pix = QPixmap()
+    if pix.loadFromData(png_bytes, "PNG") and not pix.isNull():
+        return pix
+    return None
+
+
 def _safe_filename(title: str) -> str:
     return re.sub(r"[^A-Za-z0-9._-]", "_", title).strip("_")
 
@@ -1476,13 +1489,14 @@ def get_graph_names_to_build(data: Optional[Dict[str, Any]]) -> List[str]:
     shown_outputs = (config or {}).get("shown_outputs") or {}
     video_params = (config or {}).get("video_parameters") or {}
 
+    have = set(results_df.columns)
+
     if results_df.shape[0] > 0:
         for spec in DOT_PLOT_SPECS:
             if not shown_outputs.get(spec["flag"], False):
                 continue
             missing_cols = [
-                c for c in (spec["x_col"], spec["y_col"])
-                if c not in results_df.columns
+                c for c in (spec["x_col"], spec["y_col"]) if c not in have
             ]
             if missing_cols:
                 continue
@@ -1491,12 +1505,11 @@ def get_graph_names_to_build(data: Optional[Dict[str, Any]]) -> List[str]:
             names.append(spec["title"])
 
     if shown_outputs.get("show_angle_and_distance_plot"):
-        required = ["LF_Angle", "RF_Angle", "Tail_Distance"]
-        if all(c in results_df.columns for c in required):
+        if {"LF_Angle", "RF_Angle", "Tail_Distance"} <= have:
             names.append("Fin Angles + Tail Distance")
 
     if shown_outputs.get("show_spines") and parsed_points and "spine" in parsed_points:
-        if "LF_Angle" in results_df.columns and "RF_Angle" in results_df.columns:
+        if {"LF_Angle", "RF_Angle"} <= have:
             time_ranges = _extract_time_ranges(config, results_df)
             spine_settings = (config or {}).get("spine_plot_settings") or {}
             split_by_bout = bool(spine_settings.get("split_plots_by_bout", True))
@@ -1505,12 +1518,12 @@ def get_graph_names_to_build(data: Optional[Dict[str, Any]]) -> List[str]:
             elif not split_by_bout or not time_ranges:
                 names.append("Spines Combined")
 
-    if shown_outputs.get("show_head_plot") and "HeadYaw" in results_df.columns:
+    if shown_outputs.get("show_head_plot") and "HeadYaw" in have:
         names.append("Head Orientation")
             # Issue #93: custom angle graph
     tpa = ((config or {}).get("custom_calculations") or {}).get("three_point_angle") or {}
     out_col = str(tpa.get("output_column") or "ThreePointAngle")
-    if tpa.get("enabled", False) and out_col in results_df.columns:
+    if tpa.get("enabled", False) and out_col in have:
         names.append(f"Custom Angle: {out_col}")
 
 
@@ -1535,12 +1548,27 @@ def _iter_dot_plot_graphs(
         warnings.append("No dot plot flags are enabled in the config.")
         return
 
+    # Specs share columns (Tail_Distance feeds all four): coerce each column once and
+    # hand the same contiguous array (or its per-second diff) to every plot that uses it.
+    have = set(results_df.columns)
+    columns: Dict[str, np.ndarray] = {}
+    rates: Dict[str, np.ndarray] = {}
+
+    def _column(col: str) -> np.ndarray:
+        if col not in columns:
+            columns[col] = np.ascontiguousarray(_as_numeric_array(results_df[col]))
+        return columns[col]
+
+    def _rate(col: str) -> np.ndarray:
+        if col not in rates:
+            rates[col] = np.diff(_column(col)) * framerate
+        return rates[col]
+
     for spec in DOT_PLOT_SPECS:
         if not shown_outputs.get(spec["flag"], False):
             continue
         missing_cols = [
-            col for col in (spec["x_col"], spec["y_col"])
-            if col not in results_df.columns
+            col for col in (spec["x_col"], spec["y_col"]) if col not in have
         ]
         if missing_cols:
             warnings.append(
@@ -1548,8 +1576,8 @@ def _iter_dot_plot_graphs(
                 f"{', '.join(missing_cols)} are missing."
             )
             continue
-        values_x = _as_numeric_array(results_df[spec["x_col"]])
-        values_y = _as_numeric_array(results_df[spec["y_col"]])
+        values_x = _column(spec["x_col"])
+        values_y = _column(spec["y_col"])
         if spec["moving"]:
             if framerate is None:
                 warnings.append(
@@ -1563,8 +1591,8 @@ def _iter_dot_plot_graphs(
                     "two frames are required."
                 )
                 continue
-            values_x = np.diff(values_x) * framerate
-            values_y = np.diff(values_y) * framerate
+            values_x = _rate(spec["x_col"])
+            values_y = _rate(spec["y_col"])
         try:
             result = render_dot_plot(
                 values_x, values_y,
@@ -1778,20 +1806,17 @@ def build_spine_graphs(
     return graphs, warnings
 
 
-def build_head_plot_graphs(
-    results_df: pd.DataFrame, config: Dict[str, Any]
-) -> Tuple[Dict[str, GraphSource], List[str]]:
-    graphs: Dict[str, GraphSource] = {}
-    warnings: List[str] = []
-
+def _iter_head_plot_graphs(
+    results_df: pd.DataFrame, config: Dict[str, Any], warnings: List[str]
+):
     cfg = dict(config or {})
     shown_outputs = cfg.get("shown_outputs") or {}
     if not shown_outputs.get("show_head_plot"):
-        return graphs, warnings
+        return
 
     if "HeadYaw" not in results_df.columns:
         warnings.append("Head plot skipped: missing HeadYaw column.")
-        return graphs, warnings
+        return
 
     head_settings = dict(cfg.get("head_plot_settings") or {})
     head_settings["open_plot"] = False
@@ -1816,17 +1841,49 @@ def build_head_plot_graphs(
         result = render_headplot(bundle, ctx=None)
     except Exception as exc:
         warnings.append(f"Head plot failed: {exc}")
-        return graphs, warnings
+        return
 
     warnings.extend(result.warnings)
     if result.figures:
-        graphs["Head Orientation"] = result.figures[0]
+        yield ("Head Orientation", result.figures[0])
     else:
         warnings.append("Head plot produced no figures.")
 
+
+def build_head_plot_graphs(
+    results_df: pd.DataFrame, config: Dict[str, Any]
+) -> Tuple[Dict[str, GraphSource], List[str]]:
+    warnings: List[str] = []
+    graphs: Dict[str, GraphSource] = {}
+    for name, fig in _iter_head_plot_graphs(results_df, config, warnings):
+        graphs[name] = fig
     return graphs, warnings
 
 
+# Graph families in display order: (iterator, takes parsed_points). Each iterator yields
+# (name, figure) for what the config asks for and appends its skip reasons to ``warnings``.
+GRAPH_ITERATORS: Tuple[Tuple[Callable[..., Any], bool], ...] = (
+    (_iter_dot_plot_graphs, False),
+    (_iter_fin_tail_graphs, False),
+    (_iter_spine_graphs, True),
+    (_iter_head_plot_graphs, False),
+    (_iter_custom_angle_graphs, False),
+)
+
+
+def _iter_graphs(
+    results_df: pd.DataFrame,
+    config: Dict[str, Any],
+    parsed_points: Optional[Dict[str, Any]],
+    warnings: List[str],
+):
+    for iter_fn, takes_points in GRAPH_ITERATORS:
+        if takes_points:
+            yield from iter_fn(results_df, config, parsed_points, warnings)
+        else:
+            yield from iter_fn(results_df, config, warnings)
+
+
 def build_graphs_from_data(
     data: Optional[Dict[str, Any]],
     progress_callback: Callable[[int, int, str], None],
@@ -1849,68 +1906,48 @@ def build_graphs_from_data(
         return None, None
     warnings: List[str] = []
     graphs: Dict[str, GraphSource] = {}
-    index = 0
-    for name, fig in _iter_dot_plot_graphs(results_df, config, warnings):
-        if is_cancelled is not None and is_cancelled():
-            raise CalculationAborted()
-        index += 1
-        progress_callback(index, total, name)
-        graphs[name] = fig
-    for name, fig in _iter_fin_tail_graphs(results_df, config, warnings):
-        if is_cancelled is not None and is_cancelled():
-            raise CalculationAborted()
-        index += 1
-        progress_callback(index, total, name)
-        graphs[name] = fig
-    for name, fig in _iter_spine_graphs(
-        results_df, config, parsed_points, warnings
+    for index, (name, fig) in enumerate(
+        _iter_graphs(results_df, config, parsed_points, warnings), start=1
     ):
         if is_cancelled is not None and is_cancelled():
             raise CalculationAborted()
-        index += 1
-        progress_callback(index, total, name)
-        graphs[name] = fig
-    head_graphs, head_warnings = build_head_plot_graphs(results_df, config)
-    warnings.extend(head_warnings)
-    for name, fig in head_graphs.items():
-        if is_cancelled is not None and is_cancelled():
-            raise CalculationAborted()
-        index += 1
-        progress_callback(index, total, name)
-        graphs[name] = fig
-    for name, fig in _iter_custom_angle_graphs(results_df, config, warnings):
-        if is_cancelled is not None and is_cancelled():
-            raise CalculationAborted()
-        index += 1
         progress_callback(index, total, name)
         graphs[name] = fig
 
     return graphs, config
 
 
-def save_to_html(fig: go.Figure, title: str, out_dir: Path, config: Dict[str, Any], session=None) -> None:
+def write_figure_assets(fig: go.Figure, title: str, out_dir: Path) -> Optional[str]:
+    """Write ``<title>.html`` (+ ``.png`` when Kaleido works); return the asset path to record.
+
+    Touches only the filesystem, so it is safe to call from a worker thread.
+    """
+    fname = _safe_filename(title) or "graph"
+    html_path = out_dir / f"{fname}.html"
+    png_path = out_dir / f"{fname}.png"
+
+    pio.write_html(fig, file=str(html_path), include_plotlyjs=True, auto_open=False)
+
     try:
-        fname = _safe_filename(title) or "graph"
-        html_path = out_dir / f"{fname}.html"
-        png_path = out_dir / f"{fname}.png"
+        png_bytes = pio.to_image(fig, format="png", scale=2)
+        png_path.write_bytes(png_bytes)
+    except Exception:
+        png_path = None
 
-        pio.write_html(fig, file=str(html_path), include_plotlyjs=True, auto_open=False)
+    if png_path is not None and png_path.exists():
+        return str(png_path)
+    if html_path.exists():
+        return str(html_path)
+    return None
 
-        try:
-            png_bytes = pio.to_image(fig, format="png", scale=2)
-            png_path.write_bytes(png_bytes)
-        except Exception:
-            png_path = None
 
+def save_to_html(fig: go.Figure, title: str, out_dir: Path, config: Dict[str, Any], session=None) -> None:
+    try:
+        graph_asset = write_figure_assets(fig, title, out_dir)
         if session is not None:
-            graph_asset = None
-            if png_path is not None and png_path.exists():
-                graph_asset = str(png_path)
-            elif html_path.exists():
-                graph_asset = str(html_path)
             if graph_asset is not None:
                 session.addGraphToConfig(config["config_path"], graph_asset)
             session.save()
     except Exception as e:
-        print(f"Could not save '{title}' as HTML: {e}")
+        log.warning("Could not save '%s' as HTML: %s", title, e)
 
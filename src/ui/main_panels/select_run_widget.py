@@ -7,7 +7,7 @@ from pathlib import Path
 
 from PyQt5.QtCore import QObject, QEvent, QThread, Qt, QSize, pyqtSignal, pyqtSlot
 from typing import Any
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QColor, QIcon, QPalette
 from PyQt5.QtWidgets import (
     QApplication,
     QHBoxLayout,
@@ -29,9 +29,9 @@ import src.core.parsing.Parser as parser
 
 from ui.components.branding import view_output_tool_icon
 from ui.components.scene_help import create_scene_help_button
+from ui.workers.progress_throttle import ProgressThrottle
 
-from src.app_platform.paths import default_sample_config, default_sample_csv
-from src.app_platform.paths import images_dir
+from app_platform.paths import default_sample_config, default_sample_csv, images_dir
 
 FOLDER_ICON = images_dir() / "folder-black.svg"
 
@@ -98,11 +98,10 @@ class _SingleCalcWorker(QObject):
                 self.ok.emit(payload)
                 return
 
-            def _prog(n: int, tot: int, gname: str) -> None:
-                self.graph_progress.emit(n, tot, gname)
-
             try:
-                graphs, cfg = build_graphs_from_data(payload, _prog, self._cancelled)
+                graphs, cfg = build_graphs_from_data(
+                    payload, ProgressThrottle(self.graph_progress.emit), self._cancelled
+                )
             except CalculationAborted:
                 self.cancelled.emit()
                 return
@@ -347,8 +346,6 @@ class ConfigSelectionScene(QWidget):
 
     def polish_tree_for_theme(self, theme_name: str) -> None:
         """Brighter expand/collapse affordance in dark mode (palette mid tones)."""
-        from PyQt5.QtGui import QColor, QPalette
-
         self._tree_theme = theme_name or "dark"
         self._refresh_view_output_icons_in_tree()
 
@@ -801,14 +798,14 @@ class ConfigSelectionScene(QWidget):
             str(self.csv_path), dict(config), self._cancel_event
         )
         self._calc_worker.moveToThread(self._calc_thread)
-        self._calc_thread.started.connect(self._calc_worker.work)
+        self._calc_thread.started.connect(self._calc_worker.work, Qt.DirectConnection)
         self._calc_worker.ok.connect(self._on_single_worker_ok, Qt.QueuedConnection)
         self._calc_worker.graph_progress.connect(
             self._on_graph_build_progress, Qt.QueuedConnection
         )
         self._calc_worker.err.connect(self._on_single_worker_err, Qt.QueuedConnection)
         self._calc_worker.cancelled.connect(self._on_single_worker_cancelled, Qt.QueuedConnection)
-        self._calc_thread.finished.connect(self._on_single_thread_finished)
+        self._calc_thread.finished.connect(self._on_single_thread_finished, Qt.QueuedConnection)
         self._calc_thread.start()
 
     def _on_single_thread_finished(self) -> None:
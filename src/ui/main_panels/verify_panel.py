@@ -1,6 +1,7 @@
 """Verify Upload main panel: CSV / JSON validation and session hooks."""
 
 import json
+import os
 from pathlib import Path
 
 from PyQt5.QtCore import QSize, Qt, pyqtSignal
@@ -27,8 +28,23 @@ from ui.elide_tooltip import LineEditResizeTooltipFilter, update_line_edit_elide
 from core.validation import csv_verifier as input_verifier
 from core.validation import json_verifier
 
+# ---------------------------------------------------------------------------
+# Optional orjson (C parser); stdlib json is the fallback
+# ---------------------------------------------------------------------------
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 UPLOAD_ICON = images_dir() / "upload-button.png"
 FOLDER_ICON = images_dir() / "folder-black.svg"
+# Validation console keeps only the newest lines so appends stay cheap over long sessions.
+FEEDBACK_MAX_BLOCKS = 2000
+
+
+def _safe_to_use(path: Path) -> bool:
+    """Cheap preflight before handing a path to the session (which copies / saves on the GUI thread)."""
+    return path.exists() and os.access(path, os.R_OK)
 
 
 class VerifyWorkspace(QWidget):
@@ -42,8 +58,15 @@ class VerifyWorkspace(QWidget):
     json_selected = pyqtSignal(str)
     generate_json_requested = pyqtSignal()
 
+    # kind -> (caption, name filter) for the reusable open-file dialogs.
+    _FILE_DIALOG_SPECS = {
+        "csv": ("Select CSV File", "CSV Files (*.csv)"),
+        "json": ("Select JSON File", "JSON Files (*.json)"),
+    }
+
     def __init__(self):
         super().__init__()
+        self._file_dialogs: dict[str, QFileDialog] = {}
 
         inner = QWidget()
         inner.setObjectName("VerifyWorkspaceInner")
@@ -133,6 +156,7 @@ class VerifyWorkspace(QWidget):
         self.feedback_box = QTextEdit()
         self.feedback_box.setObjectName("VerifyFeedbackBox")
         self.feedback_box.setReadOnly(True)
+        self.feedback_box.document().setMaximumBlockCount(FEEDBACK_MAX_BLOCKS)
         self.feedback_box.setMinimumHeight(max(scaled_px(180), 120))
         self.feedback_box.setAttribute(Qt.WA_StyledBackground, True)
         main_layout.addWidget(self.feedback_box)
@@ -166,10 +190,22 @@ class VerifyWorkspace(QWidget):
         super().resizeEvent(event)
         self._sync_path_field_tooltips()
 
+    def _pick_existing_file(self, kind: str) -> str:
+        """Run the cached open dialog for ``kind``; built on first use, reused afterwards."""
+        dlg = self._file_dialogs.get(kind)
+        if dlg is None:
+            caption, name_filter = self._FILE_DIALOG_SPECS[kind]
+            dlg = QFileDialog(self, caption, "", name_filter)
+            dlg.setFileMode(QFileDialog.ExistingFile)
+            dlg.setAcceptMode(QFileDialog.AcceptOpen)
+            self._file_dialogs[kind] = dlg
+        if dlg.exec_() != QFileDialog.Accepted:
+            return ""
+        files = dlg.selectedFiles()
+        return files[0] if files else ""
+
     def select_csv_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select CSV File", "", "CSV Files (*.csv)"
-        )
+        file_path = self._pick_existing_file("csv")
 
         if not file_path:
             self.feedback_box.append("Warning: CSV file selection canceled.\n")
@@ -179,11 +215,24 @@ class VerifyWorkspace(QWidget):
         self._sync_path_field_tooltips()
         self.feedback_box.append(f"\n--- Validating CSV File ---\n{file_path}\n")
 
-        if self.validate_csv(Path(file_path)):
+        if not self.validate_csv(Path(file_path)):
+            self.feedback_box.append("Error: CSV file failed validation.\n")
+        elif not _safe_to_use(Path(file_path)):
+            self.feedback_box.append("Error: CSV file is missing or not readable.\n")
+        else:
             self.feedback_box.append("Success: CSV file passed all checks.\n")
             self.csv_selected.emit(file_path)
-        else:
-            self.feedback_box.append("Error: CSV file failed validation.\n")
+
+    def _append_feedback(self, lines: list[str]) -> None:
+        """Flush a batch of console lines in one append (one layout pass, no interim repaints)."""
+        if not lines:
+            return
+        box = self.feedback_box
+        box.setUpdatesEnabled(False)
+        try:
+            box.append("\n".join(lines))
+        finally:
+            box.setUpdatesEnabled(True)
 
     def validate_csv(self, file_path: Path) -> bool:
         try:
@@ -192,21 +241,19 @@ class VerifyWorkspace(QWidget):
             self.feedback_box.append(f"Error reading CSV file:\n{exc}\n")
             return False
 
-        valid = True
+        lines: list[str] = []
         if errors:
-            valid = False
-            self.feedback_box.append("\nErrors:")
-            for err in errors:
-                self.feedback_box.append(f" - {err}")
+            lines.append("\nErrors:")
+            lines.extend(f" - {err}" for err in errors)
         if warnings:
-            self.feedback_box.append("\nWarnings:")
-            for warn in warnings:
-                self.feedback_box.append(f" - {warn}")
+            lines.append("\nWarnings:")
+            lines.extend(f" - {warn}" for warn in warnings)
 
         if not errors and not warnings:
-            self.feedback_box.append("Success: No issues found.\n")
+            lines.append("Success: No issues found.\n")
 
-        return valid
+        self._append_feedback(lines)
+        return not errors
 
     def select_csv_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder of CSV Files", "")
@@ -221,11 +268,10 @@ class VerifyWorkspace(QWidget):
 
         subdirs = [p for p in folder_path.iterdir() if p.is_dir()]
         if subdirs:
-            self.feedback_box.append(
-                "Error: Selected folder contains subfolders. Please select a folder with only CSV files.\n"
+            self._append_feedback(
+                ["Error: Selected folder contains subfolders. Please select a folder with only CSV files.\n"]
+                + [f" - Subfolder: {sd.name}" for sd in subdirs]
             )
-            for sd in subdirs:
-                self.feedback_box.append(f" - Subfolder: {sd.name}")
             return
 
         csv_files = sorted(
@@ -276,28 +322,32 @@ class VerifyWorkspace(QWidget):
                     "Ensure all CSVs are exported with the same DLC bodyparts/columns."
                 )
 
+        lines: list[str] = []
         if all_errors:
-            self.feedback_box.append("\nErrors:")
-            for line in all_errors:
-                self.feedback_box.append(f" - {line}" if not line.startswith("  ") else line)
+            lines.append("\nErrors:")
+            lines.extend(f" - {line}" if not line.startswith("  ") else line for line in all_errors)
         if all_warnings:
-            self.feedback_box.append("\nWarnings:")
-            for line in all_warnings:
-                self.feedback_box.append(f" - {line}" if not line.startswith("  ") else line)
+            lines.append("\nWarnings:")
+            lines.extend(f" - {line}" if not line.startswith("  ") else line for line in all_warnings)
 
         if all_errors:
-            self.feedback_box.append("\nError: Folder failed validation.\n")
+            lines.append("\nError: Folder failed validation.\n")
+            self._append_feedback(lines)
             return
 
-        self.feedback_box.append(
-            f"Success: Folder passed validation. {len(csv_files)} files ready.\n"
-        )
+        unreadable = [p for p in csv_files if not _safe_to_use(p)]
+        if unreadable:
+            lines.append("\nError: Some CSV files are missing or not readable:")
+            lines.extend(f" - {p.name}" for p in unreadable)
+            self._append_feedback(lines)
+            return
+
+        lines.append(f"Success: Folder passed validation. {len(csv_files)} files ready.\n")
+        self._append_feedback(lines)
         self.csv_folder_selected.emit(str(folder_path), [str(p) for p in csv_files])
 
     def select_json_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select JSON File", "", "JSON Files (*.json)"
-        )
+        file_path = self._pick_existing_file("json")
 
         if not file_path:
             self.feedback_box.append("Warning: JSON file selection canceled.\n")
@@ -307,16 +357,18 @@ class VerifyWorkspace(QWidget):
         self._sync_path_field_tooltips()
         self.feedback_box.append(f"\n--- Validating JSON File ---\n{file_path}\n")
 
-        if self.validate_json(Path(file_path)):
+        if not self.validate_json(Path(file_path)):
+            self.feedback_box.append("Error: JSON file failed validation.\n")
+        elif not _safe_to_use(Path(file_path)):
+            self.feedback_box.append("Error: JSON file is missing or not readable.\n")
+        else:
             self.feedback_box.append("Success: JSON config file is valid.\n")
             self.json_selected.emit(file_path)
-        else:
-            self.feedback_box.append("Error: JSON file failed validation.\n")
 
     def validate_json(self, file_path: Path) -> bool:
         try:
-            with file_path.open("r", encoding="utf-8") as handle:
-                config = json.load(handle)
+            raw = file_path.read_bytes()
+            config = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
         except Exception as exc:
             self.feedback_box.append(f"Error reading JSON file:\n{exc}\n")
             return False
@@ -325,22 +377,21 @@ class VerifyWorkspace(QWidget):
         if hasattr(json_verifier, "extra_checks"):
             errors.extend(json_verifier.extra_checks(config))
 
-        valid = not errors
+        lines: list[str] = []
         if errors:
-            self.feedback_box.append("\nError: Validation failed with the following issues:")
-            for err in errors:
-                self.feedback_box.append(f" - {err}")
+            lines.append("\nError: Validation failed with the following issues:")
+            lines.extend(f" - {err}" for err in errors)
         else:
-            self.feedback_box.append("\nSuccess: JSON structure matches schema.")
+            lines.append("\nSuccess: JSON structure matches schema.")
 
         if hasattr(json_verifier, "guidance_messages"):
             guidance = json_verifier.guidance_messages(config)
             if guidance:
-                self.feedback_box.append("\nGuidance:")
-                for message in guidance:
-                    self.feedback_box.append(f" - {message}")
+                lines.append("\nGuidance:")
+                lines.extend(f" - {message}" for message in guidance)
 
-        return valid
+        self._append_feedback(lines)
+        return not errors
 
 
 class VerifyPanel(QWidget):
@@ -1,4 +1,4 @@
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import QStackedWidget, QVBoxLayout, QWidget
 
 from ui.main_panels.empty_session_panel import EmptySessionPanel
@@ -9,13 +9,21 @@ from ui.main_panels.view_output_panel import ViewOutputPanel
 
 class WorkspaceWidget(QWidget):
     """
-    Hosts main-panel views. Indices: 0 empty session, 1 verify, 2 select/run, 3 view output.
+    Hosts main-panel views: empty session, verify, select/run, view output.
+
+    Only the empty-session panel is built up front; the others are constructed on first
+    access (``verify_panel`` / ``select_run_panel`` / ``view_output_panel`` or a ``show_*``
+    call) and announced through ``panel_created`` so the shell can wire their signals.
     """
 
-    IDX_EMPTY = 0
-    IDX_VERIFY = 1
-    IDX_SELECT_RUN = 2
-    IDX_VIEW_OUTPUT = 3
+    # (panel key, panel widget) — emitted once, right after a lazy panel joins the stack.
+    panel_created = pyqtSignal(str, QWidget)
+
+    _PANEL_FACTORIES = {
+        "verify": VerifyPanel,
+        "select_run": SelectRunPanel,
+        "view_output": ViewOutputPanel,
+    }
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -31,21 +39,47 @@ class WorkspaceWidget(QWidget):
         self.empty_panel = EmptySessionPanel()
         self._stack.addWidget(self.empty_panel)
 
-        self.verify_panel = VerifyPanel()
-        self._stack.addWidget(self.verify_panel)
-        self.select_run_panel = SelectRunPanel()
-        self._stack.addWidget(self.select_run_panel)
-        self.view_output_panel = ViewOutputPanel()
-        self._stack.addWidget(self.view_output_panel)
+        self._panels: dict[str, QWidget] = {}
+
+    def panel(self, key: str) -> QWidget:
+        """Return the panel for ``key``, building and adding it to the stack on first use."""
+        p = self._panels.get(key)
+        if p is None:
+            p = self._PANEL_FACTORIES[key]()
+            self._panels[key] = p
+            self._stack.addWidget(p)
+            self.panel_created.emit(key, p)
+        return p
+
+    def existing_panel(self, key: str) -> QWidget | None:
+        """The panel for ``key`` if it has been built already (never constructs)."""
+        return self._panels.get(key)
+
+    @property
+    def verify_panel(self) -> VerifyPanel:
+        return self.panel("verify")
+
+    @property
+    def select_run_panel(self) -> SelectRunPanel:
+        return self.panel("select_run")
+
+    @property
+    def view_output_panel(self) -> ViewOutputPanel:
+        return self.panel("view_output")
+
+    def is_showing(self, key: str) -> bool:
+        """True when the panel for ``key`` exists and is the stack's current widget."""
+        p = self._panels.get(key)
+        return p is not None and self._stack.currentWidget() is p
 
     def show_empty(self) -> None:
-        self._stack.setCurrentIndex(self.IDX_EMPTY)
+        self._stack.setCurrentWidget(self.empty_panel)
 
     def show_verify(self) -> None:
-        self._stack.setCurrentIndex(self.IDX_VERIFY)
+        self._stack.setCurrentWidget(self.verify_panel)
 
     def show_select_run(self) -> None:
-        self._stack.setCurrentIndex(self.IDX_SELECT_RUN)
+        self._stack.setCurrentWidget(self.select_run_panel)
 
     def show_view_output(self) -> None:
-        self._stack.setCurrentIndex(self.IDX_VIEW_OUTPUT)
+        self._stack.setCurrentWidget(self.view_output_panel)
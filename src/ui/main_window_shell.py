@@ -12,7 +12,7 @@ from datetime import datetime
 import pandas as pd
 
 from src.core.calculations.cancelled import CalculationAborted
-from PyQt5.QtCore import QEvent, QPoint, QTimer, QSize, Qt, QThread
+from PyQt5.QtCore import QEvent, QObject, QPoint, QTimer, QSize, Qt, QThread
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import (
     QApplication,
@@ -47,6 +47,8 @@ from ui.popup_panels.generate_config_dialog import GenerateConfigDialog
 from ui.popup_panels.session_select_dialog import SessionSelectDialog
 from ui.workers.folder_graph_save_worker import FolderGraphSaveWorker
 from ui.workers.folder_pipeline_worker import FolderPipelineWorker
+from ui.workers.graph_save_worker import GraphSaveWorker
+from ui.workers.progress_throttle import ProgressThrottle
 
 # winuser.h — frameless resize hit testing
 _HTLEFT = 10
@@ -129,12 +131,17 @@ class MainShellWindow(QMainWindow):
         self._verify_last_csv_path = None
         self._calculation_has_run = False
         self._view_output_sidebar_unlocked = False
+        # Panels whose load_session() is still owed for current_session (filled on first show).
+        self._session_dirty_panels: set[str] = set()
 
         self._folder_thread: QThread | None = None
         self._folder_worker: FolderPipelineWorker | None = None
         self._folder_save_thread: QThread | None = None
         self._folder_save_worker: FolderGraphSaveWorker | None = None
         self._folder_save_ctx: dict | None = None
+        self._single_save_thread: QThread | None = None
+        self._single_save_worker: GraphSaveWorker | None = None
+        self._single_save_ctx: dict | None = None
 
         self._stderr_chunks: deque[str] = deque(maxlen=400)
         self._toast_messages: deque[str] = deque(maxlen=120)
@@ -177,6 +184,9 @@ class MainShellWindow(QMainWindow):
         sw.addWidget(self.sidebar)
         body_layout.addWidget(sidebar_wrap)
 
+        # Hot-path scene refs, bound in _on_panel_created (see _config_scene / _graphs_scene).
+        self._config_scene_ref = None
+        self._graphs_scene_ref = None
         self.workspace = WorkspaceWidget()
         body_layout.addWidget(self.workspace, stretch=1)
 
@@ -191,38 +201,93 @@ class MainShellWindow(QMainWindow):
         apply_error_toast_theme(self._error_toast, THEMES[self.current_theme])
         self._error_toast.hide()
 
-        self.sidebar.tool_triggered.connect(self._on_sidebar_tool)
-        self.sidebar.settings_requested.connect(self._open_settings)
-        self.workspace.empty_panel.open_session_requested.connect(self._on_open_session)
-
-        v = self.workspace.verify_panel.verify
-        v.csv_selected.connect(self._on_verify_csv_selected)
-        v.csv_folder_selected.connect(self._on_verify_folder_selected)
-        v.json_selected.connect(self._on_verify_json_selected)
-        v.generate_json_requested.connect(self._on_verify_generate_json_requested)
-
-        self.workspace.select_run_panel.selection.data_generated.connect(
-            self._handle_calculation_data
-        )
-        self.workspace.select_run_panel.selection.view_output_requested.connect(
-            self._on_select_run_view_output
-        )
-        self.workspace.select_run_panel.selection.generate_config_copy_requested.connect(
-            self._on_select_run_generate_copy
+        # Sidebar tool key -> handler (one lookup instead of an if/elif chain per click).
+        self._sidebar_actions = {
+            "verify": self._show_verify_panel,
+            "select_run": self._show_select_run_panel,
+            "view_output": self._show_view_output_panel,
+            "generate": self._open_generate_config_dialog,
+        }
+        # (owner key, connection) for every long-lived shell slot; see _disconnect_signals.
+        self._connections: list[tuple[str, object]] = []
+        self._track("shell", self.sidebar.tool_triggered.connect(self._on_sidebar_tool))
+        self._track("shell", self.sidebar.settings_requested.connect(self._open_settings))
+        self._track(
+            "shell",
+            self.workspace.empty_panel.open_session_requested.connect(self._on_open_session),
         )
-        self.workspace.select_run_panel.selection.toast_requested.connect(self._show_error_toast)
+        # Verify / Select & Run / View Output are built on first use; wire them as they appear.
+        self._track("shell", self.workspace.panel_created.connect(self._on_panel_created))
 
         self.sidebar.reflect_theme(self.current_theme)
         self.sidebar.set_active_tool(None)
 
         self._apply_session_state()
-        self.workspace.select_run_panel.selection.polish_tree_for_theme(self.current_theme)
 
         QShortcut(QKeySequence("Ctrl+W"), self, activated=self.close)
 
         app_inst = QApplication.instance()
         if app_inst is not None:
-            app_inst.applicationStateChanged.connect(self._on_application_state_changed)
+            # The application outlives this window: this one must be dropped on close.
+            self._track(
+                "app",
+                app_inst.applicationStateChanged.connect(self._on_application_state_changed),
+            )
+
+    def _track(self, owner: str, connection) -> None:
+        self._connections.append((owner, connection))
+
+    def _disconnect_signals(self, owner: str | None = None) -> None:
+        """Disconnect tracked connections for ``owner`` (a panel key, "shell", "app"), or all."""
+        keep = []
+        for key, conn in self._connections:
+            if owner is not None and key != owner:
+                keep.append((key, conn))
+                continue
+            try:
+                QObject.disconnect(conn)
+            except (TypeError, RuntimeError):
+                pass  # sender already destroyed
+        self._connections = keep
+
+    def _on_panel_created(self, key: str, panel: QWidget) -> None:
+        """Connect a lazily built workspace panel to the shell (runs once per panel)."""
+        # A rebuilt panel must not leave the previous instance's slots attached.
+        self._disconnect_signals(key)
+        if key == "verify":
+            v = panel.verify
+            self._track(key, v.csv_selected.connect(self._on_verify_csv_selected))
+            self._track(key, v.csv_folder_selected.connect(self._on_verify_folder_selected))
+            self._track(key, v.json_selected.connect(self._on_verify_json_selected))
+            self._track(
+                key, v.generate_json_requested.connect(self._on_verify_generate_json_requested)
+            )
+        elif key == "select_run":
+            sel = panel.selection
+            self._track(key, sel.data_generated.connect(self._handle_calculation_data))
+            self._track(key, sel.view_output_requested.connect(self._on_select_run_view_output))
+            self._track(
+                key, sel.generate_config_copy_requested.connect(self._on_select_run_generate_copy)
+            )
+            self._track(key, sel.toast_requested.connect(self._show_error_toast))
+            sel.polish_tree_for_theme(self.current_theme)
+            self._config_scene_ref = sel
+        elif key == "view_output":
+            self._graphs_scene_ref = panel.viewer
+
+    @property
+    def _config_scene(self):
+        """Select & Run scene; builds its panel on first use."""
+        if self._config_scene_ref is None:
+            self.workspace.panel("select_run")
+        return self._config_scene_ref
+
+    @property
+    def _graphs_scene(self):
+        """View Output graph viewer; builds its panel on first use."""
+        if self._graphs_scene_ref is None:
+            self.workspace.panel("view_output")
+        return self._graphs_scene_ref
 
     def _on_application_state_changed(self, state: Qt.ApplicationState) -> None:
         """Hide toast when switching to another app so it does not float above the rest of the desktop."""
@@ -308,6 +373,7 @@ class MainShellWindow(QMainWindow):
             except Exception:
                 pass
             sys.stderr = self._orig_stderr
+        self._disconnect_signals()
         super().closeEvent(event)
 
     def _apply_session_state(self) -> None:
@@ -363,12 +429,25 @@ class MainShellWindow(QMainWindow):
         self._resume_workspace_from_session()
 
     def _broadcast_session_to_panels(self) -> None:
-        """Push ``current_session`` into workspace panels (Verify / Select & Run / View Output)."""
+        """Mark Select & Run / View Output as owing ``current_session``.
+
+        Panels pull the session the first time they are shown (see ``_ensure_panel_session``),
+        so a panel the user never opens never pays for ``load_session``.
+        """
         if self.current_session is None:
             return
-        self.workspace.select_run_panel.selection.load_session(self.current_session)
-        self.workspace.select_run_panel.selection.polish_tree_for_theme(self.current_theme)
-        self.workspace.view_output_panel.viewer.load_session(self.current_session)
+        self._session_dirty_panels = {"select_run", "view_output"}
+
+    def _ensure_panel_session(self, panel_key: str) -> None:
+        """Run the deferred ``load_session`` for ``panel_key`` if the current session is not attached yet."""
+        if panel_key not in self._session_dirty_panels or self.current_session is None:
+            return
+        self._session_dirty_panels.discard(panel_key)
+        if panel_key == "select_run":
+            self._config_scene.load_session(self.current_session)
+            self._config_scene.polish_tree_for_theme(self.current_theme)
+        elif panel_key == "view_output":
+            self._graphs_scene.load_session(self.current_session)
 
     def _resume_workspace_from_session(self) -> None:
         """
@@ -385,9 +464,7 @@ class MainShellWindow(QMainWindow):
             self._show_verify_panel(persist=False)
             return
 
-        has_any_config = any(bool(configs) for configs in (s.csvs or {}).values())
-
-        if not has_any_config:
+        if not s.has_any_config():
             # User has uploaded CSVs but not attached/generated a config yet.
             self._show_verify_panel(persist=False)
             self._open_generate_config_dialog()
@@ -398,7 +475,8 @@ class MainShellWindow(QMainWindow):
         last_csv = getattr(s, "last_csv_path", None)
         last_cfg = getattr(s, "last_config_path", None)
         if last_csv and last_cfg:
-            config_scene = self.workspace.select_run_panel.selection
+            self._ensure_panel_session("select_run")
+            config_scene = self._config_scene
             config_scene.set_selected_paths(last_csv, last_cfg)
         self._show_select_run_panel(persist=False)
         self._persist_last_scene("Select Configuration")
@@ -416,7 +494,7 @@ class MainShellWindow(QMainWindow):
         self._refresh_sidebar_capabilities()
 
     def _calculation_cancelled(self) -> bool:
-        return self.workspace.select_run_panel.selection.is_calculation_cancelled()
+        return self._config_scene.is_calculation_cancelled()
 
     def _deferred_view_output_after_ready(self, config_scene) -> None:
         """After 100% 'Ready', hold ~1s so the label is readable, then open Graphs and clear the bar."""
@@ -429,28 +507,32 @@ class MainShellWindow(QMainWindow):
 
     def _handle_calculation_data(self, data) -> None:
         """Orchestrate graph build after Run Calculation. Progress is monotonic; 100% only when UI is ready (#91)."""
-        config_scene = self.workspace.select_run_panel.selection
+        config_scene = self._config_scene
         if data is None:
             config_scene.finish_calculation_run()
             return
-        graphs_scene = self.workspace.view_output_panel.viewer
+        self._ensure_panel_session("view_output")
+        graphs_scene = self._graphs_scene
         is_cancel = self._calculation_cancelled
 
         if data and isinstance(data, dict) and data.get("csv_files"):
             self._start_folder_pipeline_async(data)
             return
 
+        save_pending = False
         try:
-            self._run_single_csv_calculation(
+            save_pending = self._run_single_csv_calculation(
                 data, config_scene, graphs_scene, is_cancel
             )
         except CalculationAborted:
             config_scene.set_progress(0, 0, "")
         finally:
-            config_scene.finish_calculation_run()
+            # A background figure save finishes the run from _on_single_save_* instead.
+            if not save_pending:
+                config_scene.finish_calculation_run()
 
     def _start_folder_pipeline_async(self, data: dict) -> None:
-        config_scene = self.workspace.select_run_panel.selection
+        config_scene = self._config_scene
         self._cleanup_folder_worker_handles()
         config_scene.set_progress(0, 0, "")
         config_scene.start_progress_run()
@@ -462,12 +544,12 @@ class MainShellWindow(QMainWindow):
         self._folder_thread = th
         self._folder_worker = worker
 
-        th.started.connect(worker.run)
+        th.started.connect(worker.run, Qt.DirectConnection)
         worker.progress.connect(config_scene.set_progress, Qt.QueuedConnection)
         worker.finished.connect(self._on_folder_pipeline_finished, Qt.QueuedConnection)
         worker.failed.connect(self._on_folder_pipeline_failed, Qt.QueuedConnection)
         worker.cancelled.connect(self._on_folder_pipeline_cancelled, Qt.QueuedConnection)
-        th.finished.connect(self._on_folder_thread_finished)
+        th.finished.connect(self._on_folder_thread_finished, Qt.QueuedConnection)
         th.start()
 
     def _on_folder_thread_finished(self) -> None:
@@ -512,7 +594,7 @@ class MainShellWindow(QMainWindow):
             return
         if self._calculation_cancelled():
             return
-        config_scene = self.workspace.select_run_panel.selection
+        config_scene = self._config_scene
         step = int(ctx["phase_base"]) + int(done)
         config_scene.set_progress(
             step,
@@ -522,8 +604,8 @@ class MainShellWindow(QMainWindow):
 
     def _on_folder_save_finished(self, result: dict, records: object) -> None:
         self._folder_save_ctx = None
-        config_scene = self.workspace.select_run_panel.selection
-        graphs_scene = self.workspace.view_output_panel.viewer
+        config_scene = self._config_scene
+        graphs_scene = self._graphs_scene
         if self._calculation_cancelled():
             config_scene.set_progress(0, 0, "")
             config_scene.finish_calculation_run()
@@ -548,7 +630,7 @@ class MainShellWindow(QMainWindow):
 
     def _on_folder_save_failed(self, message: str) -> None:
         self._folder_save_ctx = None
-        config_scene = self.workspace.select_run_panel.selection
+        config_scene = self._config_scene
         config_scene.set_progress(0, 0, "")
         self._show_error_toast("Saving graphs failed", message)
         config_scene.finish_calculation_run()
@@ -556,14 +638,14 @@ class MainShellWindow(QMainWindow):
 
     def _on_folder_save_cancelled(self) -> None:
         self._folder_save_ctx = None
-        config_scene = self.workspace.select_run_panel.selection
+        config_scene = self._config_scene
         config_scene.set_progress(0, 0, "")
         config_scene.finish_calculation_run()
         self._cleanup_folder_worker_handles()
 
     def _apply_folder_run_after_save(self, result: dict) -> None:
-        config_scene = self.workspace.select_run_panel.selection
-        graphs_scene = self.workspace.view_output_panel.viewer
+        config_scene = self._config_scene
+        graphs_scene = self._graphs_scene
         graphs_by_csv = result["graphs_by_csv"]
         results_by_csv = result["results_by_csv"]
         csv_files = result["csv_files"]
@@ -591,21 +673,21 @@ class MainShellWindow(QMainWindow):
         self._deferred_view_output_after_ready(config_scene)
 
     def _on_folder_pipeline_failed(self, message: str) -> None:
-        config_scene = self.workspace.select_run_panel.selection
+        config_scene = self._config_scene
         config_scene.set_progress(0, 0, "")
         self._show_error_toast("Folder run failed", message)
         config_scene.finish_calculation_run()
         self._cleanup_folder_worker_handles()
 
     def _on_folder_pipeline_cancelled(self) -> None:
-        config_scene = self.workspace.select_run_panel.selection
+        config_scene = self._config_scene
         config_scene.set_progress(0, 0, "")
         config_scene.finish_calculation_run()
         self._cleanup_folder_worker_handles()
 
     def _on_folder_pipeline_finished(self, result: dict) -> None:
-        config_scene = self.workspace.select_run_panel.selection
-        graphs_scene = self.workspace.view_output_panel.viewer
+        config_scene = self._config_scene
+        graphs_scene = self._graphs_scene
         is_cancel = self._calculation_cancelled
 
         graphs_by_csv = result["graphs_by_csv"]
@@ -654,7 +736,7 @@ class MainShellWindow(QMainWindow):
         self._folder_save_thread = th
         self._folder_save_worker = worker
 
-        th.started.connect(worker.run)
+        th.started.connect(worker.run, Qt.DirectConnection)
         worker.progress.connect(
             self._on_folder_save_progress_tick,
             Qt.QueuedConnection,
@@ -665,12 +747,13 @@ class MainShellWindow(QMainWindow):
         )
         worker.failed.connect(self._on_folder_save_failed, Qt.QueuedConnection)
         worker.cancelled.connect(self._on_folder_save_cancelled, Qt.QueuedConnection)
-        th.finished.connect(self._on_folder_save_thread_finished)
+        th.finished.connect(self._on_folder_save_thread_finished, Qt.QueuedConnection)
         th.start()
 
     def _run_single_csv_calculation(
         self, data, config_scene, graphs_scene, is_cancel
-    ) -> None:
+    ) -> bool:
+        """Show a single-CSV run's graphs; True when a background figure save is still running."""
         gcount: int = 0
         if is_cancel():
             raise CalculationAborted()
@@ -692,11 +775,16 @@ class MainShellWindow(QMainWindow):
                 _st = [2 + 2 * gcount + 2]
                 config_scene.start_progress_run()
                 config_scene.set_progress(2, _st[0], f"0/{gcount} — building graphs")
+                def _paint_progress(n, total, graph_name: str) -> None:
+                    config_scene.set_progress(2 + n, _st[0], f"{n}/{total} — {graph_name}")
+                    QApplication.processEvents()
+
+                paint_progress = ProgressThrottle(_paint_progress)
+
                 def _single_progress(n, total, graph_name: str) -> None:
                     if is_cancel():
                         raise CalculationAborted()
-                    config_scene.set_progress(2 + n, _st[0], f"{n}/{total} — {graph_name}")
-                    QApplication.processEvents()
+                    paint_progress(n, total, graph_name)
 
                 graphs, cfg = graphs_scene.build_graphs_with_progress(
                     data, _single_progress, is_cancelled=is_cancel
@@ -709,59 +797,159 @@ class MainShellWindow(QMainWindow):
         if graphs is not None and cfg is not None:
             df = data.get("results_df")
             n_fig = count_figures_in_graph_dict(graphs) if isinstance(graphs, dict) else 0
-            st_final = 2 + gcount + n_fig + 2
-
-            def _save_p(i, nt, name):
-                if is_cancel():
-                    raise CalculationAborted()
-                config_scene.set_progress(2 + gcount + i, st_final, f"Saving {i}/{nt}  —  {name}")
-                QApplication.processEvents()
-
-            def _prep():
-                if is_cancel():
-                    raise CalculationAborted()
-                config_scene.set_progress(2 + gcount + n_fig + 1, st_final, "Preparing graph viewer…")
-                QApplication.processEvents()
-
-            set_graphs_kw: dict = {}
-            if gcount > 0:
-                set_graphs_kw = {
-                    "save_progress": _save_p,
-                    "on_preparing_viewer": _prep,
-                    "is_cancelled": is_cancel,
-                }
+            ctx = {
+                "data": data,
+                "graphs": graphs,
+                "cfg": cfg,
+                "df": df,
+                "gcount": gcount,
+                "n_fig": n_fig,
+                "st_final": 2 + gcount + n_fig + 2,
+            }
+            if n_fig > 0 and cfg and getattr(graphs_scene, "current_session", None) is not None:
+                self._start_single_graph_save_async(ctx)
+                return True
+            self._show_single_csv_graphs(ctx)
+            return False
+
+        graphs_scene.set_data(data)
+        self._view_output_sidebar_unlocked = True
+        self._show_view_output_panel()
+        self._refresh_sidebar_capabilities()
+        config_scene.set_progress(0, 0, "")
+        return False
+
+    def _show_single_csv_graphs(self, ctx: dict) -> None:
+        """Hand saved single-CSV graphs to View Output (GUI thread, after any disk save)."""
+        config_scene = self._config_scene
+        graphs_scene = self._graphs_scene
+        is_cancel = self._calculation_cancelled
+        data = ctx["data"]
+        cfg = ctx["cfg"]
+        df = ctx["df"]
+        gcount = ctx["gcount"]
+        n_fig = ctx["n_fig"]
+        st_final = ctx["st_final"]
+
+        def _prep():
+            if is_cancel():
+                raise CalculationAborted()
+            config_scene.set_progress(2 + gcount + n_fig + 1, st_final, "Preparing graph viewer…")
+
+        # Figures were already written by GraphSaveWorker, so no config → no second save here.
+        graphs_scene.set_graphs(
+            ctx["graphs"],
+            config=None,
+            results_df=df if isinstance(df, pd.DataFrame) else None,
+            on_preparing_viewer=_prep if gcount > 0 else None,
+        )
+        try:
+            graphs_scene.set_context(
+                csv_id=data.get("csv_path") if isinstance(data, dict) else None,
+                config_path=(cfg.get("config_path") if isinstance(cfg, dict) else None),
+                csv_files=None,
+            )
+        except Exception:
+            pass
+        if gcount > 0:
+            # "Ready" paints when control returns to the event loop; the 1 s hold below is a
+            # QTimer continuation, so no manual processEvents() is needed here.
+            config_scene.set_progress(st_final, st_final, "Ready")
+            self._deferred_view_output_after_ready(config_scene)
+        else:
+            self._persist_calculation_succeeded()
+            self._show_view_output_panel()
+            config_scene.set_progress(0, 0, "")
+
+    def _start_single_graph_save_async(self, ctx: dict) -> None:
+        config_scene = self._config_scene
+        graphs_scene = self._graphs_scene
+        self._cleanup_single_save_handles()
+        self._single_save_ctx = ctx
+
+        out_dir = sessions_dir() / graphs_scene.current_session.getName()
+        th = QThread()
+        worker = GraphSaveWorker(out_dir, ctx["graphs"], config_scene.calculation_cancel_event())
+        worker.moveToThread(th)
+        self._single_save_thread = th
+        self._single_save_worker = worker
+
+        th.started.connect(worker.run, Qt.DirectConnection)
+        worker.progress.connect(self._on_single_save_progress, Qt.QueuedConnection)
+        worker.finished.connect(self._on_single_save_finished, Qt.QueuedConnection)
+        worker.failed.connect(self._on_single_save_failed, Qt.QueuedConnection)
+        worker.cancelled.connect(self._on_single_save_cancelled, Qt.QueuedConnection)
+        th.finished.connect(self._on_single_save_thread_finished, Qt.QueuedConnection)
+        th.start()
+
+    def _on_single_save_thread_finished(self) -> None:
+        self._single_save_thread = None
+        if self._single_save_worker is not None:
+            self._single_save_worker.deleteLater()
+            self._single_save_worker = None
+
+    def _cleanup_single_save_handles(self) -> None:
+        self._single_save_ctx = None
+        if self._single_save_thread is not None:
             try:
-                graphs_scene.set_graphs(
-                    graphs,
-                    config=cfg,
-                    results_df=df if isinstance(df, pd.DataFrame) else None,
-                    **set_graphs_kw,
-                )
-            except CalculationAborted:
-                raise
+                self._single_save_thread.quit()
+                self._single_save_thread.wait(3000)
+            except Exception:
+                pass
+        self._single_save_thread = None
+        self._single_save_worker = None
+
+    def _on_single_save_progress(self, done: int, n: int, name: str) -> None:
+        ctx = self._single_save_ctx
+        if ctx is None or self._calculation_cancelled():
+            return
+        gcount = int(ctx["gcount"])
+        if gcount > 0:
+            self._config_scene.set_progress(
+                2 + gcount + done, int(ctx["st_final"]), f"Saving {done}/{n}  —  {name}"
+            )
+
+    def _on_single_save_finished(self, assets: object) -> None:
+        ctx = self._single_save_ctx
+        self._single_save_ctx = None
+        config_scene = self._config_scene
+        graphs_scene = self._graphs_scene
+        if ctx is None or self._calculation_cancelled():
+            config_scene.set_progress(0, 0, "")
+            config_scene.finish_calculation_run()
+            self._cleanup_single_save_handles()
+            return
+        sess = getattr(graphs_scene, "current_session", None)
+        config_path = ctx["cfg"].get("config_path") if isinstance(ctx["cfg"], dict) else None
+        if sess is not None:
+            if config_path:
+                for asset in assets if isinstance(assets, list) else []:
+                    sess.addGraphToConfig(config_path, asset)
             try:
-                graphs_scene.set_context(
-                    csv_id=data.get("csv_path") if isinstance(data, dict) else None,
-                    config_path=(cfg.get("config_path") if isinstance(cfg, dict) else None),
-                    csv_files=None,
-                )
+                sess.save()
             except Exception:
                 pass
-            QApplication.processEvents()
-            if gcount > 0:
-                config_scene.set_progress(st_final, st_final, "Ready")
-                QApplication.processEvents()
-                self._deferred_view_output_after_ready(config_scene)
-            else:
-                self._persist_calculation_succeeded()
-                self._show_view_output_panel()
-        else:
-            graphs_scene.set_data(data)
-            self._view_output_sidebar_unlocked = True
-            self._show_view_output_panel()
-            self._refresh_sidebar_capabilities()
-        if not (graphs is not None and cfg is not None and gcount > 0):
+        try:
+            self._show_single_csv_graphs(ctx)
+        except CalculationAborted:
             config_scene.set_progress(0, 0, "")
+        finally:
+            config_scene.finish_calculation_run()
+
+    def _on_single_save_failed(self, message: str) -> None:
+        self._single_save_ctx = None
+        config_scene = self._config_scene
+        config_scene.set_progress(0, 0, "")
+        self._show_error_toast("Saving graphs failed", message)
+        config_scene.finish_calculation_run()
+        self._cleanup_single_save_handles()
+
+    def _on_single_save_cancelled(self) -> None:
+        self._single_save_ctx = None
+        config_scene = self._config_scene
+        config_scene.set_progress(0, 0, "")
+        config_scene.finish_calculation_run()
+        self._cleanup_single_save_handles()
 
     def _open_settings(self) -> None:
         from ui.popup_panels.settings_dialog import SettingsDialog
@@ -791,12 +979,17 @@ class MainShellWindow(QMainWindow):
         if app_inst is not None and path.is_file():
             base = scale_stylesheet(path.read_text(encoding="utf-8"), scale)
             th_name = prefs.theme if prefs.theme in THEMES else "dark"
-            app_inst.setStyleSheet(base + application_tooltip_stylesheet(THEMES[th_name]))
+            app_qss = base + application_tooltip_stylesheet(THEMES[th_name])
+            # Preview fires on every settings tweak; an unchanged app sheet would still re-polish everything.
+            if app_inst.styleSheet() != app_qss:
+                app_inst.setStyleSheet(app_qss)
         self.current_theme = prefs.theme if prefs.theme in THEMES else "dark"
         apply_theme(self, THEMES[self.current_theme])
         apply_error_toast_theme(self._error_toast, THEMES[self.current_theme])
         self.sidebar.reflect_theme(self.current_theme)
-        self.workspace.select_run_panel.selection.polish_tree_for_theme(self.current_theme)
+        select_run = self.workspace.existing_panel("select_run")
+        if select_run is not None:
+            select_run.selection.polish_tree_for_theme(self.current_theme)
         self._error_toast.reposition_if_visible()
 
     def _reapply_ui_preferences(self) -> None:
@@ -811,19 +1004,35 @@ class MainShellWindow(QMainWindow):
         except Exception:
             pass
 
+    def _panel_already_shown(self, panel_key: str, scene_name: str) -> bool:
+        """True when ``panel_key`` is on screen and ``scene_name`` is already the saved resume point."""
+        if not self.workspace.is_showing(panel_key):
+            return False
+        s = self.current_session
+        return s is None or s.last_scene == scene_name
+
     def _show_verify_panel(self, persist: bool = True) -> None:
+        # Re-selecting the current panel would only re-save the session and re-highlight.
+        if self._panel_already_shown("verify", "Verify"):
+            return
         if persist:
             self._persist_last_scene("Verify")
         self.workspace.show_verify()
         self.sidebar.set_active_tool("verify")
 
     def _show_select_run_panel(self, persist: bool = True) -> None:
+        self._ensure_panel_session("select_run")
+        if self._panel_already_shown("select_run", "Select Configuration"):
+            return
         if persist:
             self._persist_last_scene("Select Configuration")
         self.workspace.show_select_run()
         self.sidebar.set_active_tool("select_run")
 
     def _show_view_output_panel(self, persist: bool = True) -> None:
+        self._ensure_panel_session("view_output")
+        if self._panel_already_shown("view_output", "Graphs"):
+            return
         if persist:
             self._persist_last_scene("Graphs")
         self.workspace.show_view_output()
@@ -894,7 +1103,7 @@ class MainShellWindow(QMainWindow):
     def _on_select_run_view_output(self, csv_path: str, config_path: str) -> None:
         self._view_output_sidebar_unlocked = True
         self._show_view_output_panel()
-        self.workspace.view_output_panel.viewer.show_graphs_for_csv_config(csv_path, config_path)
+        self._graphs_scene.show_graphs_for_csv_config(csv_path, config_path)
         self._refresh_sidebar_capabilities()
 
     def _on_select_run_generate_copy(self, csv_path: str, config_path: str) -> None:
@@ -941,11 +1150,6 @@ class MainShellWindow(QMainWindow):
             self._warn_sidebar_blocked()
             self._show_error_toast("Sidebar", blocked)
             return
-        if key == "verify":
-            self._show_verify_panel()
-        elif key == "select_run":
-            self._show_select_run_panel()
-        elif key == "view_output":
-            self._show_view_output_panel()
-        elif key == "generate":
-            self._open_generate_config_dialog()
+        action = self._sidebar_actions.get(key)
+        if action is not None:
+            action()
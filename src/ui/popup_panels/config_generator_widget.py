@@ -55,6 +55,35 @@ class ConfigGeneratorScene(QWidget):
     # (title, short_body) for shell ErrorToast; full text always printed to stderr.
     toast_requested = pyqtSignal(str, str)
 
+    # Shared by all four chip pools; kept at class scope so the QSS text is built once.
+    _CHIP_POOL_QSS = """
+        QListWidget {
+            background-color: rgba(40, 40, 48, 0.85);
+            border: 1px solid rgba(100, 100, 120, 0.9);
+            border-radius: 8px;
+            padding: 6px;
+            outline: none;
+        }
+        QListWidget::item {
+            background-color: rgba(50, 50, 60, 0.95);
+            border: 1px solid rgba(120, 120, 140, 0.85);
+            border-radius: 6px;
+            padding: 4px 8px;
+            margin: 2px;
+        }
+        QListWidget::item:hover {
+            background-color: rgba(70, 72, 90, 0.98);
+            border: 1px solid rgba(160, 165, 200, 0.95);
+        }
+        QListWidget::item:selected, QListWidget::item:selected:active {
+            background-color: rgba(60, 90, 150, 0.85);
+            border: 1px solid rgba(140, 180, 255, 0.9);
+        }
+        QListWidget::item:pressed {
+            background-color: rgba(90, 100, 140, 0.95);
+        }
+    """
+
     def __init__(self, csv_path=None, parent=None):
         super().__init__(parent)
 
@@ -598,35 +627,7 @@ class ConfigGeneratorScene(QWidget):
     def _apply_chip_pool_styles(self) -> None:
         """Rounded chip look + pool surface; :hover / :selected differ so clicks read as feedback."""
         for obj in (self.bp_available_spine, self.bp_available_tail, self.spine_list, self.tail_list):
-            obj.setStyleSheet(
-                """
-                QListWidget {
-                    background-color: rgba(40, 40, 48, 0.85);
-                    border: 1px solid rgba(100, 100, 120, 0.9);
-                    border-radius: 8px;
-                    padding: 6px;
-                    outline: none;
-                }
-                QListWidget::item {
-                    background-color: rgba(50, 50, 60, 0.95);
-                    border: 1px solid rgba(120, 120, 140, 0.85);
-                    border-radius: 6px;
-                    padding: 4px 8px;
-                    margin: 2px;
-                }
-                QListWidget::item:hover {
-                    background-color: rgba(70, 72, 90, 0.98);
-                    border: 1px solid rgba(160, 165, 200, 0.95);
-                }
-                QListWidget::item:selected, QListWidget::item:selected:active {
-                    background-color: rgba(60, 90, 150, 0.85);
-                    border: 1px solid rgba(140, 180, 255, 0.9);
-                }
-                QListWidget::item:pressed {
-                    background-color: rgba(90, 100, 140, 0.95);
-                }
-            """
-            )
+            obj.setStyleSheet(self._CHIP_POOL_QSS)
 
     def _polish_bodypart_combos(self) -> None:
         def _tip_from_elide(cc: QComboBox, t: str) -> None:
@@ -173,12 +173,13 @@ def _safe_session_stem(raw: str) -> str:
 
 def _session_name_taken(root: Path, stem: str) -> bool:
     """Bundle ``<stem>/session.json`` or legacy flat ``<stem>.json``."""
-    return session_json_path(stem).is_file() or (root / f"{stem}.json").is_file()
+    return (root / stem / SESSION_JSON_FILENAME).is_file() or (root / f"{stem}.json").is_file()
 
 
-def unique_session_stem(base: str) -> str:
+def unique_session_stem(base: str, root: Path | None = None) -> str:
     """If that session id is already used on disk, return base_2, base_3, …"""
-    root = sessions_dir()
+    if root is None:
+        root = sessions_dir()
     root.mkdir(parents=True, exist_ok=True)
     b = _safe_session_stem(base) or "session"
     candidate = b
@@ -691,8 +692,7 @@ class SessionSelectDialog(FramelessResizeMixin, QDialog):
             return
 
         root = sessions_dir()
-        root.mkdir(parents=True, exist_ok=True)
-        stem = unique_session_stem(src.stem)
+        stem = unique_session_stem(src.stem, root)
         bundle = root / stem
         bundle.mkdir(parents=True, exist_ok=True)
         dst = bundle / SESSION_JSON_FILENAME
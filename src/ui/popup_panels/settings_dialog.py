@@ -5,6 +5,7 @@ from __future__ import annotations
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
     QAbstractButton,
+    QApplication,
     QButtonGroup,
     QDialog,
     QFrame,
@@ -144,8 +145,6 @@ class SettingsDialog(FramelessResizeMixin, QDialog):
 
     def _resize_window_sensibly(self) -> None:
         """Cap dialog height to the viewport; body scrolls."""
-        from PyQt5.QtWidgets import QApplication
-
         scr = QApplication.primaryScreen()
         geo = scr.availableGeometry() if scr is not None else None
         max_h = int(geo.height() * 0.92) if geo is not None else 1200
@@ -170,8 +169,6 @@ class SettingsDialog(FramelessResizeMixin, QDialog):
         return b
 
     def _screen_metrics(self) -> tuple[float, int, int, float]:
-        from PyQt5.QtWidgets import QApplication
-
         dpi = 96.0
         w, h = 1920, 1080
         dpr = 1.0
@@ -13,6 +13,8 @@ from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.core.calculations.cancelled import CalculationAborted
 
+from ui.workers.progress_throttle import ProgressThrottle
+
 
 def _safe_filename(title: str) -> str:
     return re.sub(r"[^A-Za-z0-9._-]", "_", title).strip("_")
@@ -160,7 +162,7 @@ class FolderGraphSaveWorker(QObject):
                 config_path=self._config_path,
                 graphs_by_csv=self._graphs_by_csv,
                 cancel_check=self._ce.is_set,
-                on_progress=self._emit_progress,
+                on_progress=ProgressThrottle(self._emit_progress),
             )
             self.finished.emit(records)
         except CalculationAborted:
@@ -16,6 +16,7 @@ from ui.main_panels.graph_viewer_widget import (
     build_graphs_from_data,
     get_graph_names_to_build,
 )
+from ui.workers.progress_throttle import ProgressThrottle
 
 
 class FolderPipelineError(Exception):
@@ -103,6 +104,7 @@ def run_folder_pipeline_core(
     )
 
     step = 2 * total_files
+    graph_progress = ProgressThrottle(on_progress)
     file_payloads = [
         (
             p,
@@ -128,7 +130,7 @@ def run_folder_pipeline_core(
             if cancel_event.is_set():
                 raise CalculationAborted()
             step += 1
-            on_progress(
+            graph_progress(
                 step,
                 total_steps,
                 f"{Path(_csv).name}  —  {n}/{gtotal}  —  {graph_name}",
@@ -0,0 +1,90 @@
+"""Background export of single-CSV Plotly figures to HTML/PNG (keeps GUI thread free)."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import plotly.graph_objs as go
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from src.core.calculations.cancelled import CalculationAborted
+
+from ui.main_panels.graph_viewer_widget import write_figure_assets
+from ui.workers.progress_throttle import ProgressThrottle
+
+log = logging.getLogger(__name__)
+
+
+def run_graph_save_core(
+    *,
+    out_dir: Path,
+    graphs: Dict[str, Any],
+    cancel_check: Callable[[], bool],
+    on_progress: Optional[Callable[[int, int, str], None]],
+) -> List[str]:
+    """
+    Write each ``go.Figure`` in ``graphs`` under ``out_dir``; return the asset paths for
+    :meth:`session.Session.addGraphToConfig` (applied on the GUI thread, then one ``save()``).
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fig_items = [(n, f) for n, f in (graphs or {}).items() if isinstance(f, go.Figure)]
+    n_total = len(fig_items)
+    assets: List[str] = []
+    for i, (title, fig) in enumerate(fig_items, start=1):
+        if cancel_check():
+            raise CalculationAborted()
+        if on_progress is not None:
+            on_progress(i, n_total, title)
+        try:
+            asset = write_figure_assets(fig, title, out_dir)
+        except Exception as e:
+            log.warning("Could not save '%s' as HTML: %s", title, e)
+            continue
+        if asset is not None:
+            assets.append(asset)
+    return assets
+
+
+class GraphSaveWorker(QObject):
+    """Runs :func:`run_graph_save_core` on a worker thread."""
+
+    progress = pyqtSignal(int, int, str)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(
+        self,
+        out_dir: Path,
+        graphs: Dict[str, Any],
+        cancel_event: threading.Event,
+    ):
+        super().__init__()
+        self._out_dir = Path(out_dir)
+        self._graphs = graphs
+        self._ce = cancel_event
+
+    def _emit_progress(self, done: int, total: int, msg: str) -> None:
+        self.progress.emit(done, total, msg)
+
+    @pyqtSlot()
+    def run(self) -> None:
+        th = self.thread()
+        try:
+            assets = run_graph_save_core(
+                out_dir=self._out_dir,
+                graphs=self._graphs,
+                cancel_check=self._ce.is_set,
+                on_progress=ProgressThrottle(self._emit_progress),
+            )
+            self.finished.emit(assets)
+        except CalculationAborted:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            if th is not None:
+                th.quit()
@@ -0,0 +1,34 @@
+"""Rate limiter for per-graph progress callbacks (one tick per figure floods repaints)."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+# ~30 Hz is as fast as a progress bar / label is worth repainting.
+PROGRESS_MIN_INTERVAL_S = 1.0 / 30.0
+
+
+class ProgressThrottle:
+    """
+    Wrap ``callback(n, total, msg)`` so ticks closer than ``min_interval`` apart are dropped.
+
+    The first tick and the final ``n >= total`` tick always go through, so the bar never
+    stalls short of its end value.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[int, int, str], None],
+        min_interval: float = PROGRESS_MIN_INTERVAL_S,
+    ):
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_progress_ts = 0.0
+
+    def __call__(self, n: int, total: int, msg: str) -> None:
+        now = time.monotonic()
+        if now - self._last_progress_ts < self._min_interval and n < total:
+            return
+        self._last_progress_ts = now
+        self._callback(n, total, msg)
@@ -7,6 +7,8 @@
 #
 # UI scale: px/pt in generated QSS are scaled via ``styles.ui_scale`` (global factor from preferences).
 
+from string import Template
+
 from styles.ui_scale import get_ui_scale_factor, scale_stylesheet
 
 LIGHT_THEME = {
@@ -91,27 +93,35 @@ THEMES = {
 }
 
 
+_TOOLTIP_QSS_TEMPLATE = Template("""
+        QToolTip {
+            font-size: 10pt;
+            padding: 3px 6px;
+            background-color: $bg;
+            color: $fg;
+            border: 1px solid $line;
+        }
+    """)
+
+
+def _build_tooltip_qss(theme: dict) -> str:
+    return _TOOLTIP_QSS_TEMPLATE.substitute(
+        bg=theme.get("tooltip_bg", theme["panel_chrome"]),
+        fg=theme.get("tooltip_fg", theme["text"]),
+        line=theme["chrome_line"],
+    )
+
+
 def application_tooltip_stylesheet(theme: dict) -> str:
     """
     QToolTip widgets use the QApplication stylesheet (not only MainShellWindow).
     Append this to the scaled ``app.qss`` so tooltip colors follow light/dark theme.
     """
-    bg = theme.get("tooltip_bg", theme["panel_chrome"])
-    fg = theme.get("tooltip_fg", theme["text"])
-    line = theme["chrome_line"]
-    raw = f"""
-        QToolTip {{
-            font-size: 10pt;
-            padding: 3px 6px;
-            background-color: {bg};
-            color: {fg};
-            border: 1px solid {line};
-        }}
-    """
-    return scale_stylesheet(raw, get_ui_scale_factor())
+    return _cached_scaled_qss("tooltip", theme, _build_tooltip_qss)
 
 
-def apply_theme(app, theme):
+def _build_theme_qss(theme: dict) -> str:
+    """Unscaled shell QSS for ``theme`` (see :func:`apply_theme`)."""
     pm = theme["panel_main"]
     pc = theme["panel_chrome"]
     cb = theme["chrome_button"]
@@ -811,54 +821,81 @@ def apply_theme(app, theme):
             font-weight: bold;
         }}
     """
-    qss = scale_stylesheet(qss, get_ui_scale_factor())
-    app.setStyleSheet(qss)
+    return qss
 
 
-def apply_error_toast_theme(toast, theme: dict) -> None:
-    """Top-level :class:`ErrorToast` does not inherit ``MainShellWindow`` QSS; mirror the ErrorToast rules here."""
-    pc = theme["panel_chrome"]
-    tx = theme["text"]
-    line = theme["chrome_line"]
-    cb = theme["chrome_button"]
-    btxt = theme["button_text"]
-    tmenu = theme["title_menu_text"]
-    accent = theme["accent"]
-    raw = f"""
-        QWidget#ErrorToast {{
-            background-color: {pc};
-            color: {tx};
-            border: 1px solid {line};
+# (sheet kind, theme items, UI scale) -> scaled QSS. Only a handful of entries ever exist
+# (2 themes × scales the user has tried), so formatted + scaled sheets are reused across toggles.
+_THEME_QSS_CACHE: dict[tuple, str] = {}
+
+
+def _cached_scaled_qss(kind: str, theme: dict, build) -> str:
+    key = (kind, frozenset(theme.items()), get_ui_scale_factor())
+    qss = _THEME_QSS_CACHE.get(key)
+    if qss is None:
+        qss = scale_stylesheet(build(theme), key[2])
+        _THEME_QSS_CACHE[key] = qss
+    return qss
+
+
+def theme_stylesheet(theme: dict) -> str:
+    """Scaled shell QSS for ``theme`` at the current UI scale (cached)."""
+    return _cached_scaled_qss("shell", theme, _build_theme_qss)
+
+
+def apply_theme(app, theme):
+    qss = theme_stylesheet(theme)
+    # setStyleSheet re-polishes the whole widget tree even for an identical sheet; skip no-ops.
+    if app.styleSheet() != qss:
+        app.setStyleSheet(qss)
+
+
+_ERROR_TOAST_QSS_TEMPLATE = Template("""
+        QWidget#ErrorToast {
+            background-color: $panel_chrome;
+            color: $text;
+            border: 1px solid $chrome_line;
             border-radius: 10px;
-        }}
-        QWidget#ErrorToast QLabel#ErrorToastTitle {{
+        }
+        QWidget#ErrorToast QLabel#ErrorToastTitle {
             background-color: transparent;
-            color: {tx};
+            color: $text;
             font-size: 14px;
             font-weight: bold;
-        }}
-        QWidget#ErrorToast QLabel#ErrorToastBody {{
+        }
+        QWidget#ErrorToast QLabel#ErrorToastBody {
             background-color: transparent;
-            color: {tmenu};
+            color: $title_menu_text;
             font-size: 13px;
-        }}
+        }
         QWidget#ErrorToast QPushButton#ErrorToastConsoleBtn,
-        QWidget#ErrorToast QPushButton#ErrorToastCloseBtn {{
-            background-color: {cb};
-            color: {btxt};
-            border: 1px solid {line};
+        QWidget#ErrorToast QPushButton#ErrorToastCloseBtn {
+            background-color: $chrome_button;
+            color: $button_text;
+            border: 1px solid $chrome_line;
             border-radius: 6px;
             padding: 4px 10px;
             min-height: 28px;
-        }}
-        QWidget#ErrorToast QPushButton#ErrorToastCloseBtn {{
+        }
+        QWidget#ErrorToast QPushButton#ErrorToastCloseBtn {
             font-size: 18px;
             font-weight: bold;
             padding: 2px 12px;
-        }}
+        }
         QWidget#ErrorToast QPushButton#ErrorToastConsoleBtn:hover,
-        QWidget#ErrorToast QPushButton#ErrorToastCloseBtn:hover {{
-            border: 1px solid {accent};
-        }}
-    """
-    toast.setStyleSheet(scale_stylesheet(raw, get_ui_scale_factor()))
+        QWidget#ErrorToast QPushButton#ErrorToastCloseBtn:hover {
+            border: 1px solid $accent;
+        }
+    """)
+
+
+def _build_error_toast_qss(theme: dict) -> str:
+    # Theme keys double as placeholder names; unused keys are ignored by substitute().
+    return _ERROR_TOAST_QSS_TEMPLATE.substitute(theme)
+
+
+def apply_error_toast_theme(toast, theme: dict) -> None:
+    """Top-level :class:`ErrorToast` does not inherit ``MainShellWindow`` QSS; mirror the ErrorToast rules here."""
+    qss = _cached_scaled_qss("error_toast", theme, _build_error_toast_qss)
+    if toast.styleSheet() != qss:
+        toast.setStyleSheet(qss)
@@ -13,6 +13,9 @@ def _ensure_src_on_path() -> None:
         path_str = str(path)
         if path_str not in sys.path:
             sys.path.insert(0, path_str)
+    # Drop repeated entries (first occurrence wins) so import lookups scan each dir once.
+    seen: set[str] = set()
+    sys.path[:] = [p for p in sys.path if not (p in seen or seen.add(p))]
 
 
 _ensure_src_on_path()
@@ -2,6 +2,8 @@ import numpy as np
 import numpy.testing as npt
 
 from cvzebrafish.core.calculations.Metrics import (
+    MetricsContext,
+    PointArray,
     calc_fin_angle,
     calc_yaw,
     calc_tail_side_and_distance,
@@ -85,6 +87,48 @@ def test_furthest_tail_point_identifies_max_offset_segment():
     assert list(furthest) == ["p2", "p1"]
 
 
+def test_point_arrays_match_dict_inputs():
+    clp1 = {"x": np.array([0.0, 0.0]), "y": np.array([0.0, 0.0])}
+    clp2 = {"x": np.array([1.0, 1.0]), "y": np.array([0.0, 0.0])}
+    tp = {"x": np.array([1.0, -1.0]), "y": np.array([1.0, -1.0])}
+    packed = [PointArray.of(p) for p in (clp1, clp2, tp)]
+
+    assert packed[2].xy.shape == (2, 2)
+    npt.assert_array_equal(packed[2]["x"], tp["x"])
+    npt.assert_array_equal(calc_tail_angle(*packed), calc_tail_angle(clp1, clp2, tp))
+    npt.assert_array_equal(calc_yaw(*packed[:2]), calc_yaw(clp1, clp2))
+
+
+def test_metrics_context_matches_per_call_functions():
+    clp1 = {"x": np.array([0.0, 0.0, 2.0]), "y": np.array([0.0, 0.0, 1.0])}
+    clp2 = {"x": np.array([1.0, 1.0, 2.0]), "y": np.array([0.0, 0.0, 1.0])}
+    tp = {"x": np.array([1.0, -1.0, 3.0]), "y": np.array([1.0, -1.0, 0.0])}
+    fins = [tp, clp1]
+    axis = MetricsContext(clp1, clp2)
+
+    npt.assert_array_equal(axis.yaw(), calc_yaw(clp1, clp2))
+    npt.assert_array_equal(
+        axis.fin_angle(fins, left_fin=True), calc_fin_angle(clp1, clp2, fins, left_fin=True)
+    )
+    # Third frame has a zero-length axis: angle and distance are undefined there.
+    npt.assert_array_equal(axis.tail_angle(tp), calc_tail_angle(clp1, clp2, tp))
+    assert np.isnan(axis.tail_angle(tp)[2])
+    for got, expected in zip(
+        axis.tail_side_and_distance(tp, 2.0), calc_tail_side_and_distance(clp1, clp2, tp, 2.0)
+    ):
+        npt.assert_array_equal(got, expected)
+
+
+def test_metrics_context_float32_opt_in():
+    clp1 = {"x": np.array([0.0, 0.0]), "y": np.array([0.0, 0.0])}
+    clp2 = {"x": np.array([1.0, 1.0]), "y": np.array([0.0, 0.0])}
+    tp = {"x": np.array([1.0, -1.0]), "y": np.array([1.0, -1.0])}
+
+    angles = MetricsContext(clp1, clp2, dtype=np.float32).tail_angle(tp)
+    assert angles.dtype == np.float32
+    npt.assert_allclose(angles, np.array([90.0, 26.565051]), atol=1e-4)
+
+
 def test_detect_fin_peaks_marks_local_extrema():
     signal = np.array([0.0, 1.0, 0.0, -1.0, 0.0])
     peaks = detect_fin_peaks(signal, buffer=1)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import plotly.graph_objs as go
+import pytest
+
+from src.core.calculations.cancelled import CalculationAborted
+from ui.workers.graph_save_worker import run_graph_save_core
+
+
+def _fig() -> go.Figure:
+    return go.Figure(go.Scatter(x=[0, 1], y=[1, 0]))
+
+
+def test_run_graph_save_core_writes_one_asset_per_figure(tmp_path):
+    """Only Figures are written; progress counts them and each yields one recorded asset."""
+    graphs = {"Fin Angles": _fig(), "Saved PNG": tmp_path / "old.png", "Spines": _fig()}
+    ticks = []
+
+    assets = run_graph_save_core(
+        out_dir=tmp_path / "out",
+        graphs=graphs,
+        cancel_check=lambda: False,
+        on_progress=lambda i, n, name: ticks.append((i, n, name)),
+    )
+
+    assert ticks == [(1, 2, "Fin Angles"), (2, 2, "Spines")]
+    assert len(assets) == 2
+    assert all(Path(a).exists() for a in assets)
+    assert (tmp_path / "out" / "Fin_Angles.html").exists()
+
+
+def test_run_graph_save_core_honours_cancel(tmp_path):
+    with pytest.raises(CalculationAborted):
+        run_graph_save_core(
+            out_dir=tmp_path,
+            graphs={"Fin Angles": _fig()},
+            cancel_check=lambda: True,
+            on_progress=None,
+        )
+    assert not (tmp_path / "Fin_Angles.html").exists()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from ui.workers.progress_throttle import ProgressThrottle
+
+
+def test_progress_throttle_drops_burst_but_keeps_first_and_final():
+    """A burst of ticks collapses to the first one plus the forced ``n == total`` tick."""
+    ticks = []
+    throttle = ProgressThrottle(lambda n, t, msg: ticks.append((n, t, msg)), min_interval=60.0)
+
+    for n in range(1, 11):
+        throttle(n, 10, f"graph {n}")
+
+    assert ticks == [(1, 10, "graph 1"), (10, 10, "graph 10")]
+
+
+def test_progress_throttle_passes_everything_without_interval():
+    ticks = []
+    throttle = ProgressThrottle(lambda n, t, msg: ticks.append(n), min_interval=0.0)
+
+    for n in range(1, 4):
+        throttle(n, 3, "")
+
+    assert ticks == [1, 2, 3]